@@ -0,0 +1,53 @@
+"""
+Benchmark of typescript type translation on very large literals, unions and choices.
+
+Run in the project environment: poetry run python benchmarks/bench_large_unions.py
+"""
+
+import timeit
+from typing import Literal, Union
+
+import django
+from django.conf import settings
+
+settings.configure(INSTALLED_APPS=("rest_framework", "django_rest_tsg"))
+django.setup()
+
+from rest_framework.serializers import ChoiceField  # noqa: E402
+
+from django_rest_tsg.typescript import (  # noqa: E402
+    TypeRegistry,
+    build_type,
+    get_serializer_field_type,
+    use_registry,
+)
+
+
+def build_type_uncached(tp):
+    # a fresh registry has no cached translations
+    with use_registry(TypeRegistry()):
+        return build_type(tp)
+
+
+def main():
+    for size in (100, 1000, 10000):
+        number = 10 if size >= 10000 else 100
+        literal = Literal[tuple(f"code{i}" for i in range(size))]
+        union = Union[tuple(type(f"Code{i}", (), {}) for i in range(size))]
+        field = ChoiceField(choices=[(i, f"code{i}") for i in range(size)])
+        cases = {
+            "literal": lambda: build_type_uncached(literal),
+            "union": lambda: build_type_uncached(union),
+            "choices": lambda: get_serializer_field_type(field),
+        }
+        for name, case in cases.items():
+            seconds = timeit.timeit(case, number=number)
+            print(
+                f"{name:<8} size={size:<6}"
+                f" {seconds / number * 1e6:12.1f} us/annotation"
+                f" {seconds / number / size * 1e9:8.1f} ns/member"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class TypeScriptGeneratorConfig(AppConfig):
@@ -6,4 +7,6 @@ class TypeScriptGeneratorConfig(AppConfig):
     verbose = "Django REST TypeScript Generator"
 
     def ready(self):
-        pass
+        from django_rest_tsg.checks import check_freshness
+
+        checks.register(check_freshness)
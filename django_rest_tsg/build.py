@@ -1,25 +1,100 @@
 import logging
 import hashlib
-from dataclasses import dataclass, is_dataclass
+import json
+import re
+import os
+import subprocess
+import sys
+import sysconfig
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import chain
+from dataclasses import dataclass, field, is_dataclass
 from datetime import datetime
 from enum import EnumMeta
+from functools import partial
+from inspect import isclass
 from pathlib import Path
-from typing import Type, List, Dict, TypedDict, Union
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Type,
+    List,
+    Dict,
+    TypedDict,
+    Union,
+    Optional,
+    Iterable,
+    Iterator,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from django.conf import settings
+from django.utils.translation import get_language
 from inflection import dasherize, underscore
+from rest_framework.metadata import SimpleMetadata
+from rest_framework.pagination import BasePagination
+from rest_framework.routers import BaseRouter
 from rest_framework.serializers import Serializer
 
+import django_rest_tsg
 from django_rest_tsg import VERSION
-from django_rest_tsg.templates import HEADER_TEMPLATE, IMPORT_TEMPLATE
+from django_rest_tsg.client import DEFAULT_CLIENT_NAME, build_client, uses_pagination
+from django_rest_tsg.converters import build_mapper, build_reviver
+from django_rest_tsg.lock import FULL_BUILD_KEY, BuildLock
+from django_rest_tsg.validators import build_validator
+from django_rest_tsg.templates import (
+    HEADER_TEMPLATE,
+    IMPORT_TEMPLATE,
+    IMPORT_TYPE_TEMPLATE,
+    PAGINATED_ALIAS_TEMPLATE,
+    SHARED_TYPE_TEMPLATE,
+)
 from django_rest_tsg.typescript import (
+    PAGINATED_NAME,
     TypeScriptCode,
     TypeScriptCodeType,
+    TypeScriptEnumStyle,
+    LIBRARY_PACKAGES,
+    TypeRegistry,
     build_enum,
     build_interface_from_dataclass,
     build_interface_from_serializer,
+    build_paginated_interface,
+    get_interface_base,
+    get_registry,
     get_serializer_prefix,
     register,
+    use_registry,
+)
+
+SHARED_TYPES_STEM = "shared-types"
+PAGINATED_STEM = "paginated"
+TSCONFIG_FILENAME = "tsconfig.json"
+AGGREGATES_TSCONFIG_FILENAME = "tsconfig.aggregates.json"
+TSCONFIG_SOURCE = "django_rest_tsg.tsconfig"
+SHARED_TYPES_SOURCE = "django_rest_tsg.shared_types"
+INTERFACE_FIELD_PATTERN = re.compile(r"^  (?P<name>\w+): (?P<type>.+);$", re.MULTILINE)
+SHAREABLE_IDENTIFIERS = frozenset(
+    (
+        "any",
+        "Array",
+        "boolean",
+        "Date",
+        "false",
+        "index",
+        "key",
+        "null",
+        "number",
+        "object",
+        "string",
+        "true",
+    )
 )
 
 
@@ -30,66 +105,243 @@ class BuildException(Exception):
 @dataclass
 class TypeScriptBuildTask:
     type: Type
-    code: TypeScriptCode
+    code: Optional[TypeScriptCode]
     options: dict
+    factory: Optional[Callable[[], TypeScriptCode]] = field(
+        default=None, repr=False, compare=False
+    )
+    router: Optional[BaseRouter] = field(default=None, repr=False, compare=False)
+
+    @property
+    def key(self) -> Any:
+        """
+        Identity of task, which is the router instance of client tasks.
+        """
+        return self.type if self.router is None else self.router
+
+    @property
+    def name(self) -> str:
+        """
+        Unique name of task, where client tasks are named after their clients too.
+        """
+        name = get_type_name(self.type)
+        if self.router is not None:
+            name += ":" + self.options.get("alias", DEFAULT_CLIENT_NAME)
+        return name
 
     @property
     def filename(self):
-        if issubclass(self.type, Serializer):
+        return self.get_filename()
+
+    @property
+    def code_type(self) -> TypeScriptCodeType:
+        """
+        Type of code, known without generating it.
+        """
+        if isinstance(self.type, EnumMeta):
+            return TypeScriptCodeType.ENUM
+        if issubclass(self.type, BaseRouter):
+            return TypeScriptCodeType.CLIENT
+        return TypeScriptCodeType.INTERFACE
+
+    @property
+    def is_declarable(self) -> bool:
+        """
+        Whether the task can be emitted as a declaration file without runtime code.
+        """
+        if self.code_type == TypeScriptCodeType.ENUM:
+            enum_style = self.options.get("enum_style", TypeScriptEnumStyle.ENUM)
+            return TypeScriptEnumStyle(enum_style) is TypeScriptEnumStyle.CONST
+        return self.code_type == TypeScriptCodeType.INTERFACE
+
+    def get_code(self) -> TypeScriptCode:
+        """
+        Get code, which is generated on demand for lazy tasks.
+        """
+        if self.code is None:
+            self.code = self.factory()
+        return self.code
+
+    def get_dependencies(self) -> List[Type]:
+        """
+        Get dependencies of code, without keeping code of lazy tasks generated.
+        """
+        loaded = self.code is not None
+        dependencies = self.get_code().dependencies
+        if not loaded:
+            self.release()
+        return dependencies
+
+    def release(self):
+        """
+        Release code of lazy task, which is generated again on demand.
+        """
+        if self.factory is not None:
+            self.code = None
+
+    def get_filename(self, declaration: bool = False) -> str:
+        if self.code_type == TypeScriptCodeType.CLIENT:
+            default_stem = DEFAULT_CLIENT_NAME
+        elif issubclass(self.type, Serializer):
             default_stem = get_serializer_prefix(self.type)
         else:
             default_stem = self.type.__name__
         stem = dasherize(underscore(self.options.get("alias", default_stem)))
-        if self.code.type == TypeScriptCodeType.ENUM:
-            result = f"{stem}.enum.ts"
+        if self.code_type == TypeScriptCodeType.ENUM:
+            stem = f"{stem}.enum"
+        if declaration and self.is_declarable:
+            result = f"{stem}.d.ts"
         else:
             result = f"{stem}.ts"
         return result
 
 
+@dataclass
+class TypeScriptBuildResult:
+    """
+    Generated file of a build task or an aggregate artifact.
+    """
+
+    path: Path
+    content: str
+    source: str
+    dependencies: List[Path] = field(default_factory=list)
+
+    @property
+    def digest(self) -> str:
+        return get_content_digest(self.content)
+
+
 class TypeScriptBuildOptions(TypedDict, total=False):
     alias: str
     build_dir: Union[str, Path]
     enforce_uppercase: bool
+    enum_style: Union[TypeScriptEnumStyle, str]
+    extends: bool
+    paginated: Union[bool, str]
 
 
 @dataclass
 class TypeScriptBuilderConfig:
-    tasks: List[TypeScriptBuildTask]
+    tasks: Union[
+        Iterable[TypeScriptBuildTask], Callable[[], Iterable[TypeScriptBuildTask]]
+    ]
     build_dir: Union[str, Path]
+    shared_types: bool = False
+    shared_types_threshold: int = 24
+    type_only_imports: bool = False
+    declaration: bool = False
+    revivers: bool = False
+    mappers: bool = False
+    validators: bool = False
+    pagination_class: Optional[Type[BasePagination]] = None
+    project_references: bool = False
+    tsconfig_extends: Optional[Path] = None
+    lock: bool = False
+    manifest: Optional[Path] = None
+    metadata: Optional[Path] = None
+    dependency_closure: bool = False
+    config_file: Optional[Path] = None
+    # time sources of tasks were loaded, creation of builder by default
+    loaded: Optional[float] = None
+
+
+LAZY_TASKS: ContextVar[bool] = ContextVar("django_rest_tsg_lazy_tasks", default=False)
+
+
+@contextmanager
+def lazy_tasks():
+    """
+    Build tasks lazily by default in current context.
+    """
+    token = LAZY_TASKS.set(True)
+    try:
+        yield
+    finally:
+        LAZY_TASKS.reset(token)
 
 
 def build(
-    tp: Type,
+    tp: Union[Type, BaseRouter],
     options: TypeScriptBuildOptions = None,
+    lazy: Optional[bool] = None,
 ) -> TypeScriptBuildTask:
     """
     Shortcut factory for TypeScriptBuildTask.
+
+    A router instance builds an api client for all its registered viewsets.
+    Code of lazy tasks is generated on demand and released after writing.
+    Tasks are lazy by default within lazy_tasks(), while clients and extending
+    interfaces are always lazy, since they refer to serializers or bases by names
+    which may be aliased by later tasks.
+    Aliases are registered to the type registry of current context.
     """
     if options is None:
         options = {}
-    alias = options.get("alias")
-    if alias:
-        register(tp, alias)
-    code: TypeScriptCode
-    if not options:
-        options = {}
-    if issubclass(tp, Serializer):
-        code = build_interface_from_serializer(tp, interface_name=alias)
-    elif isinstance(tp, EnumMeta):
-        code = build_enum(
-            tp,
-            enum_name=alias,
-            enforce_uppercase=options.get("enforce_uppercase", False),
-        )
-    elif is_dataclass(tp):
-        code = build_interface_from_dataclass(tp, interface_name=alias)
-    else:
-        raise BuildException(f"Unsupported build type: {tp.__name__}")
+    if lazy is None:
+        lazy = LAZY_TASKS.get()
     build_dir = options.get("build_dir")
     if build_dir and isinstance(build_dir, str):
         options["build_dir"] = Path(build_dir)
-    return TypeScriptBuildTask(type=tp, code=code, options=options)
+    alias = options.get("alias")
+    factory: Callable[[], TypeScriptCode]
+    router = None
+    base = None
+    if isinstance(tp, BaseRouter):
+        factory = partial(build_client, tp, client_name=alias)
+        task_type = type(tp)
+        router = tp
+    else:
+        if alias:
+            register(tp, alias)
+        base = get_interface_base(tp) if options.get("extends") else None
+        if issubclass(tp, Serializer):
+            factory = partial(
+                build_interface_from_serializer, tp, interface_name=alias, base=base
+            )
+        elif isinstance(tp, EnumMeta):
+            factory = partial(
+                build_enum,
+                tp,
+                enum_name=alias,
+                enforce_uppercase=options.get("enforce_uppercase", False),
+                enum_style=options.get("enum_style", TypeScriptEnumStyle.ENUM),
+            )
+        elif is_dataclass(tp):
+            factory = partial(
+                build_interface_from_dataclass, tp, interface_name=alias, base=base
+            )
+        else:
+            raise BuildException(f"Unsupported build type: {tp.__name__}")
+        task_type = tp
+    if lazy or router is not None or base is not None:
+        # generate code with aliases registered in the same scope later
+        factory = partial(build_in_registry, get_registry(), factory)
+        return TypeScriptBuildTask(
+            type=task_type, code=None, options=options, factory=factory, router=router
+        )
+    return TypeScriptBuildTask(
+        type=task_type, code=factory(), options=options, router=router
+    )
+
+
+def get_imported_dependencies(
+    task: TypeScriptBuildTask, runtime_imports: Dict[Type, List[str]]
+) -> List[Type]:
+    """
+    Get dependencies of task code, followed by types only imported at runtime.
+    """
+    dependencies = task.get_code().dependencies
+    return dependencies + [
+        dependency for dependency in runtime_imports if dependency not in dependencies
+    ]
+
+
+def build_in_registry(
+    registry: TypeRegistry, factory: Callable[[], TypeScriptCode]
+) -> TypeScriptCode:
+    with use_registry(registry):
+        return factory()
 
 
 def get_relative_path(path: Path, dependency_path: Path) -> str:
@@ -111,6 +363,342 @@ def get_relative_path(path: Path, dependency_path: Path) -> str:
     return parents + "/".join(dependency_path.parts[break_idx:])
 
 
+def is_shareable_type(representation: str, threshold: int) -> bool:
+    """
+    Check whether an inline type is complex enough to be shared as an alias.
+
+    Only self-contained types are shareable, i.e. types referencing nothing
+    but built-in TypeScript types and literals.
+    """
+    if len(representation) < threshold:
+        return False
+    if not any(token in representation for token in ("{", "<", "|", "[]")):
+        return False
+    identifiers = re.findall(
+        r"[A-Za-z_$][\w$]*", re.sub(r"'[^']*'", "", representation)
+    )
+    return all(identifier in SHAREABLE_IDENTIFIERS for identifier in identifiers)
+
+
+def get_shared_type_name(representation: str) -> str:
+    """{[key: string]: number} -> SharedType0c8f2e1a"""
+    return "SharedType" + hashlib.sha256(representation.encode("utf8")).hexdigest()[:8]
+
+
+def get_changed_files(since: str) -> List[Path]:
+    """
+    List python files changed since the git ref, including untracked ones.
+    """
+    commands = (
+        ["git", "diff", "--name-only", since, "--", "*.py"],
+        ["git", "ls-files", "--others", "--exclude-standard", "--", "*.py"],
+    )
+    try:
+        toplevel = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+        output = "".join(
+            subprocess.run(
+                command, capture_output=True, check=True, cwd=toplevel, text=True
+            ).stdout
+            for command in commands
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        raise BuildException(f"Failed to list changed files since {since}: {e}")
+    return [Path(toplevel) / line for line in output.splitlines() if line]
+
+
+def get_type_modules(tp: Type) -> Set[str]:
+    """
+    Get names of modules defining the type, its bases and serialized model or dataclass.
+    """
+    modules = {cls.__module__ for cls in getattr(tp, "__mro__", (tp,))}
+    meta = getattr(tp, "Meta", None)
+    for attr in ("model", "dataclass"):
+        related = getattr(meta, attr, None)
+        if related is not None:
+            modules |= {cls.__module__ for cls in related.__mro__}
+    return modules
+
+
+def get_module_file(module_name: str) -> Optional[Path]:
+    module = sys.modules.get(module_name)
+    filename = getattr(module, "__file__", None)
+    if not filename:
+        return None
+    return Path(filename).resolve()
+
+
+EXTERNAL_PACKAGES = ("django", "django_rest_tsg", *LIBRARY_PACKAGES)
+
+
+def get_library_paths() -> List[Path]:
+    """
+    Get directories of the standard library and installed packages.
+    """
+    paths = sysconfig.get_paths()
+    return [
+        Path(paths[key]).resolve()
+        for key in ("stdlib", "platstdlib", "purelib", "platlib")
+        if key in paths
+    ]
+
+
+def get_project_module_files(module_names: Iterable[str]) -> Set[Path]:
+    """
+    Get files of project modules, leaving out the standard library, django, django
+    rest framework and other installed packages, whose paths depend on the machine.
+    """
+    library_paths = get_library_paths()
+    files = set()
+    for module_name in module_names:
+        if module_name.partition(".")[0] in EXTERNAL_PACKAGES:
+            continue
+        file = get_module_file(module_name)
+        if file is None or any(path in file.parents for path in library_paths):
+            continue
+        files.add(file)
+    return files
+
+
+def get_type_name(tp: Type) -> str:
+    return ".".join((tp.__module__, tp.__qualname__))
+
+
+def get_content_digest(content_without_header: str) -> str:
+    return hashlib.sha256(content_without_header.encode("utf8")).hexdigest()
+
+
+def is_fresh(typescript_file: Path, content_without_header: str) -> bool:
+    """
+    Check whether the generated file exists with the same content.
+    """
+    if not typescript_file.exists():
+        return False
+    return get_digest(typescript_file) == get_content_digest(content_without_header)
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """2/4 -> (2, 4)"""
+    index, _, count = value.partition("/")
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        raise BuildException(f"Invalid shard: {value}")
+    if not 1 <= index <= count:
+        raise BuildException(f"Invalid shard: {value}")
+    return index, count
+
+
+def partition_tasks(
+    tasks: Iterable[TypeScriptBuildTask],
+    count: int,
+    costs: Optional[Dict[str, float]] = None,
+) -> List[List[TypeScriptBuildTask]]:
+    """
+    Partition tasks into shards deterministically, balanced by historical costs.
+
+    Tasks are assigned from the most costly to the least costly shard.
+    Unknown costs default to the mean of known costs.
+    """
+    costs = costs or {}
+    default_cost = sum(costs.values()) / len(costs) if costs else 1.0
+    weighted_tasks = sorted(
+        (
+            (
+                costs.get(task.name, default_cost),
+                task.name,
+                task,
+            )
+            for task in tasks
+        ),
+        key=lambda item: (-item[0], item[1]),
+    )
+    shards: List[List[TypeScriptBuildTask]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for cost, _, task in weighted_tasks:
+        i = min(range(count), key=lambda j: (loads[j], j))
+        shards[i].append(task)
+        loads[i] += cost
+    return shards
+
+
+Node = TypeVar("Node")
+
+
+def find_cycle(
+    graph: Dict[Node, Collection[Node]], key: Optional[Callable[[Node], Any]] = None
+) -> List[Node]:
+    """
+    Find a cycle of directed graph, or an empty list if it is acyclic.
+
+    Nodes are visited in order sorted by key.
+    """
+    visiting: List[Node] = []
+    visited: Set[Node] = set()
+
+    def visit(node: Node) -> List[Node]:
+        if node in visiting:
+            return visiting[visiting.index(node) :] + [node]
+        if node in visited:
+            return []
+        visiting.append(node)
+        for child in sorted(graph.get(node, ()), key=key):
+            cycle = visit(child)
+            if cycle:
+                return cycle
+        visiting.pop()
+        visited.add(node)
+        return []
+
+    for node in sorted(graph, key=key):
+        cycle = visit(node)
+        if cycle:
+            return cycle
+    return []
+
+
+def is_buildable(tp: Type) -> bool:
+    """
+    Check whether a dependency can be built by build() without options.
+    """
+    return (
+        isinstance(tp, EnumMeta)
+        or is_dataclass(tp)
+        or (isclass(tp) and issubclass(tp, Serializer))
+    )
+
+
+@dataclass
+class TypeScriptBuildGraph:
+    """
+    Dependency closure of build tasks, where every type has a single task.
+
+    Tasks are keyed by task.key, so that clients of different routers are kept apart.
+    Dependencies which cannot be built are kept as unresolved.
+    """
+
+    tasks: Dict[Type, TypeScriptBuildTask] = field(default_factory=dict)
+    dependencies: Dict[Type, List[Type]] = field(default_factory=dict)
+    unresolved: Set[Type] = field(default_factory=set)
+
+    def find_cycle(self) -> List[Type]:
+        return find_cycle(self.dependencies, key=lambda key: self.tasks[key].name)
+
+    def get_order(self) -> List[TypeScriptBuildTask]:
+        """
+        Get tasks in topological order, dependencies first.
+
+        Ties keep the order of tasks, and tasks in cycles follow the others.
+        """
+        dependents: Dict[Type, List[Type]] = {tp: [] for tp in self.tasks}
+        pending: Dict[Type, int] = {}
+        for tp, dependencies in self.dependencies.items():
+            pending[tp] = len(dependencies)
+            for dependency in dependencies:
+                dependents[dependency].append(tp)
+        ready = deque(tp for tp in self.tasks if not pending[tp])
+        order = []
+        while ready:
+            tp = ready.popleft()
+            order.append(tp)
+            for dependent in dependents[tp]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    ready.append(dependent)
+        if len(order) < len(self.tasks):
+            ordered = set(order)
+            order += [tp for tp in self.tasks if tp not in ordered]
+        return [self.tasks[tp] for tp in order]
+
+
+def build_graph(tasks: Iterable[TypeScriptBuildTask]) -> TypeScriptBuildGraph:
+    """
+    Build dependency closure of tasks.
+
+    A task is added for every buildable dependency whose module is not generated yet,
+    e.g. a dataclass and its serializer share a module, owned by the first task.
+    Dependencies of each task are collected once, generating code of lazy tasks on
+    demand.
+    """
+    graph = TypeScriptBuildGraph()
+    owners: Dict[Tuple[Optional[Path], str], Type] = {}
+    for task in tasks:
+        graph.tasks.setdefault(task.key, task)
+        owners.setdefault((task.options.get("build_dir"), task.filename), task.key)
+    queue = deque(graph.tasks)
+    while queue:
+        tp = queue.popleft()
+        dependencies = []
+        for dependency in dict.fromkeys(graph.tasks[tp].get_dependencies()):
+            if dependency not in graph.tasks:
+                if not is_buildable(dependency):
+                    graph.unresolved.add(dependency)
+                    continue
+                task = build(dependency, lazy=True)
+                owner = owners.setdefault((None, task.filename), dependency)
+                if owner is dependency:
+                    # kept until written, so that it is generated once
+                    task.get_code()
+                    graph.tasks[dependency] = task
+                    queue.append(dependency)
+                dependency = owner
+            if dependency is not tp:
+                dependencies.append(dependency)
+        graph.dependencies[tp] = list(dict.fromkeys(dependencies))
+    return graph
+
+
+def get_tsconfig_path(directory: Path, path: Path) -> str:
+    """
+    Get path relative to directory of tsconfig.json, e.g. ./sub or ../tsconfig.base.json.
+    """
+    relative_path = Path(os.path.relpath(path, directory)).as_posix()
+    if relative_path.startswith("."):
+        return relative_path
+    return "./" + relative_path
+
+
+def get_module_path(path: Path) -> Path:
+    """
+    Get path of typescript module without suffix, as imported by other modules.
+    """
+    for suffix in (".d.ts", ".ts"):
+        if path.name.endswith(suffix):
+            return path.with_name(path.name[: -len(suffix)])
+    return path
+
+
+def get_file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def get_stale_files(manifest_file: Path) -> List[Path]:
+    """
+    Get sources and outputs changed since the manifest was written.
+
+    Only sources and headers of outputs are read, so nothing is regenerated.
+    A manifest written by another generator version is stale itself.
+    """
+    manifest = json.loads(manifest_file.read_text())
+    if manifest.get("version") != VERSION:
+        return [manifest_file]
+    base_dir = manifest_file.parent
+    stale_files = []
+    for path, digest in manifest["sources"].items():
+        source = base_dir / path
+        if not source.exists() or get_file_digest(source) != digest:
+            stale_files.append(source)
+    for path, digest in manifest["outputs"].items():
+        output = base_dir / path
+        if not output.exists() or get_digest(output) != digest:
+            stale_files.append(output)
+    return stale_files
+
+
 def get_digest(typescript_file: Path) -> str:
     with typescript_file.open("r") as f:
         for i, line in enumerate(f):
@@ -124,83 +712,757 @@ def get_digest(typescript_file: Path) -> str:
 
 class TypeScriptBuilder:
     def __init__(self, config: TypeScriptBuilderConfig):
+        self.loaded = time.time() if config.loaded is None else config.loaded
         self.logger = logging.getLogger("django-rest-tsg")
         log_level = logging.DEBUG if settings.DEBUG else logging.INFO
         self.logger.setLevel(log_level)
-        handler = logging.StreamHandler()
-        handler.setLevel(log_level)
-        formatter = logging.Formatter("%(asctime)s|%(name)s|%(levelname)s|%(message)s")
-        handler.setFormatter(formatter)
-        self.logger.addHandler(handler)
-        self.tasks = config.tasks
+        if not self.logger.handlers:
+            handler = logging.StreamHandler()
+            handler.setLevel(log_level)
+            formatter = logging.Formatter(
+                "%(asctime)s|%(name)s|%(levelname)s|%(message)s"
+            )
+            handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
+        tasks = config.tasks
+        if callable(tasks):
+            tasks = tasks()
+        # lazy tasks keep only types and options until built
+        self.tasks = list(tasks)
+        self.graph: Optional[TypeScriptBuildGraph] = None
+        if config.dependency_closure:
+            self.graph = build_graph(self.tasks)
+            for dependency in sorted(self.graph.unresolved, key=get_type_name):
+                self.logger.warning(
+                    f'Dependency "{get_type_name(dependency)}" cannot be built.'
+                )
+            cycle = self.graph.find_cycle()
+            if cycle:
+                self.logger.info(
+                    "Circular dependencies found: "
+                    + " -> ".join(tp.__name__ for tp in cycle)
+                )
+            self.tasks = self.graph.get_order()
         self.build_dir = config.build_dir
+        self.shared_types = config.shared_types
+        self.shared_types_threshold = config.shared_types_threshold
+        self.shared_type_mapping: Dict[str, str] = {}
+        self.type_only_imports = config.type_only_imports
+        self.declaration = config.declaration
+        self.revivers = config.revivers
+        self.mappers = config.mappers
+        self.validators = config.validators
+        self.pagination_class = config.pagination_class
+        self.project_references = config.project_references
+        self.tsconfig_extends = config.tsconfig_extends
+        self.lock = config.lock
+        self.manifest = config.manifest
+        self.metadata = config.metadata
+        self.config_file = config.config_file
         self.type_options_mapping: Dict[Type, TypeScriptBuildOptions] = {}
+        self.type_task_mapping: Dict[Type, TypeScriptBuildTask] = {}
         self.logger.info(f"{len(self.tasks)} build tasks found.")
         for task in self.tasks:
             self.logger.debug(f'Build task found: "{task.type.__name__}".')
-            self.type_options_mapping[task.type] = task.options
+            self.type_options_mapping[task.key] = task.options
+            self.type_task_mapping[task.key] = task
 
-    def build_all(self):
-        for task in self.tasks:
+    def build_all(self, tasks: Optional[Iterable[TypeScriptBuildTask]] = None):
+        """
+        Build tasks, or all tasks by default.
+
+        With lock enabled, concurrent invocations wait for each other, and a build
+        whose sources were loaded after this one was requested, or after the last
+        change of sources, is reused instead of repeated. Builds are recorded as
+        started when their sources were loaded.
+        """
+        if not self.lock:
+            self.build_tasks(tasks)
+            return
+        requested = time.time()
+        if tasks is not None:
+            tasks = list(tasks)
+        key = self.get_build_key(tasks)
+        with BuildLock(Path(self.build_dir)) as lock:
+            if lock.is_covered(requested, key, self.get_source_files()):
+                self.logger.info(
+                    "Build coalesced with a concurrent one. Skip building."
+                )
+                return
+            self.build_tasks(tasks)
+            lock.record(min(self.loaded, requested), key)
+
+    def get_build_key(
+        self, tasks: Optional[Iterable[TypeScriptBuildTask]] = None
+    ) -> str:
+        """
+        Get key of tasks identifying builds with the same outputs.
+        """
+        if tasks is None:
+            return FULL_BUILD_KEY
+        names = sorted(task.name for task in tasks)
+        if names == sorted(task.name for task in self.tasks):
+            return FULL_BUILD_KEY
+        return hashlib.sha1("\n".join(names).encode("utf8")).hexdigest()
+
+    def build_tasks(self, tasks: Optional[Iterable[TypeScriptBuildTask]] = None):
+        if tasks is None:
+            tasks = self.tasks
+        if self.shared_types:
+            self.shared_type_mapping = self.collect_shared_types()
+            self.logger.info(f"{len(self.shared_type_mapping)} shared types found.")
+        for task in tasks:
             self.logger.info(f'Building "{task.type.__name__}"...')
             self.build_task(task)
+            task.release()
+        self.build_aggregates()
+        if self.manifest:
+            self.write_manifest()
+        if self.metadata:
+            self.write_metadata()
+
+    def write_manifest(self):
+        """
+        Write fingerprints of sources and outputs for cheap freshness checks.
+        """
+        results = [self.render_and_release(task) for task in self.tasks]
+        results += self.render_aggregates()
+        modules = set()
+        for task in self.tasks:
+            modules |= self.get_task_modules(task)
+        sources = get_project_module_files(modules)
+        if self.config_file:
+            sources.add(self.config_file.resolve())
+        base_dir = self.manifest.parent
+        manifest = {
+            "version": VERSION,
+            "sources": {
+                os.path.relpath(source, base_dir): get_file_digest(source)
+                for source in sources
+                if source.exists()
+            },
+            "outputs": {
+                os.path.relpath(result.path, base_dir): result.digest
+                for result in results
+            },
+        }
+        base_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+        self.logger.debug(f'Manifest saved as "{self.manifest}".')
+
+    def write_metadata(self):
+        """
+        Write OPTIONS metadata of serializers for StaticMetadata.
+        """
+        metadata = SimpleMetadata()
+        serializers = {
+            get_type_name(task.type): metadata.get_serializer_info(task.type())
+            for task in self.tasks
+            if issubclass(task.type, Serializer)
+        }
+        artifact = {
+            "version": VERSION,
+            "language": get_language(),
+            "serializers": serializers,
+        }
+        self.metadata.parent.mkdir(parents=True, exist_ok=True)
+        # labels and help texts are lazy translations
+        self.metadata.write_text(json.dumps(artifact, indent=2, default=str))
+        self.logger.debug(f'Metadata saved as "{self.metadata}".')
+
+    def build_shard(
+        self, index: int, count: int, costs: Optional[Dict[str, float]] = None
+    ) -> dict:
+        """
+        Build tasks of a shard and get its manifest for merging.
+
+        Tasks must be lazy, so that code of other shards is never kept. Aggregate
+        artifacts are built by every shard, so that merging can verify them, except
+        project references, which are rendered by merging.
+        """
+        eager = [task.name for task in self.tasks if task.factory is None]
+        if eager:
+            raise BuildException(f"Sharded builds need lazy tasks. Eager: {eager}.")
+        tasks = partition_tasks(self.tasks, count, costs)[index - 1]
+        self.logger.info(f"{len(tasks)} build tasks in shard {index}/{count}.")
+        if self.shared_types:
+            self.shared_type_mapping = self.collect_shared_types()
+        records = []
+        for task in tasks:
+            self.logger.info(f'Building "{task.type.__name__}"...')
+            start = time.perf_counter()
+            result = self.build_task(task)
+            task.release()
+            record = self.get_stream_record(result)
+            record["cost"] = time.perf_counter() - start
+            records.append(record)
+        aggregates = [
+            self.get_stream_record(result)
+            for result in self.build_aggregates(project_references=False)
+        ]
+        return {
+            "version": VERSION,
+            "shard": index,
+            "count": count,
+            "tasks": records,
+            "aggregates": aggregates,
+        }
+
+    def get_manifest_record(self, result: TypeScriptBuildResult) -> dict:
+        return {
+            "source": result.source,
+            "path": Path(os.path.relpath(result.path, self.build_dir)).as_posix(),
+            "digest": result.digest,
+            "content": result.content,
+        }
+
+    def merge_shards(self, manifests: List[dict]) -> Dict[str, float]:
+        """
+        Write outputs of all shards into build directory and get per-task costs.
+
+        Shards must be complete, cover every task exactly once and agree on aggregate
+        artifacts, while contents must match their digests. Project references are
+        rendered from imports recorded by shards.
+        """
+        counts = {manifest["count"] for manifest in manifests}
+        if len(counts) != 1:
+            raise BuildException(f"Shards of different counts: {sorted(counts)}.")
+        count = counts.pop()
+        shards = sorted(manifest["shard"] for manifest in manifests)
+        if shards != list(range(1, count + 1)):
+            raise BuildException(f"Incomplete shards {shards} of {count}.")
+        records: Dict[str, dict] = {}
+        aggregates: Dict[str, dict] = {}
+        for manifest in manifests:
+            for record in manifest["tasks"] + manifest["aggregates"]:
+                if get_content_digest(record["content"]) != record["digest"]:
+                    raise BuildException(f'Digest mismatch of "{record["path"]}".')
+            for record in manifest["tasks"]:
+                if record["source"] in records:
+                    raise BuildException(f'Duplicated task "{record["source"]}".')
+                records[record["source"]] = record
+            for record in manifest["aggregates"]:
+                existing = aggregates.setdefault(record["path"], record)
+                if existing["digest"] != record["digest"]:
+                    raise BuildException(f'Inconsistent aggregate "{record["path"]}".')
+        expected = {task.name for task in self.tasks}
+        if expected != set(records):
+            missing = sorted(expected - set(records))
+            unexpected = sorted(set(records) - expected)
+            raise BuildException(
+                f"Shards do not match build tasks. Missing: {missing}. "
+                f"Unexpected: {unexpected}."
+            )
+        results = [
+            TypeScriptBuildResult(
+                path=self.build_dir / record["path"],
+                content=record["content"],
+                source=record["source"],
+                dependencies=[
+                    self.build_dir / module for module in record["dependencies"]
+                ],
+            )
+            for record in chain(records.values(), aggregates.values())
+        ]
+        if self.project_references:
+            results += self.render_project_references(results)
+        for result in results:
+            self.write(result.path, result.content, result.source)
+        return {source: record["cost"] for source, record in records.items()}
+
+    def get_source_files(self) -> Set[Path]:
+        """
+        Get files of loaded project modules and config, which sources are read from.
+        """
+        sources = get_project_module_files(list(sys.modules))
+        if self.config_file:
+            sources.add(self.config_file.resolve())
+        return sources
 
-    def build_task(self, task: TypeScriptBuildTask):
-        type_options = self.type_options_mapping.get(task.type, {})
-        build_dir = type_options.get("build_dir", self.build_dir)
-        build_dir.mkdir(parents=True, exist_ok=True)
-        typescript_file = build_dir / task.filename
-        hexdigest = None
-        if typescript_file.exists():
-            hexdigest = get_digest(typescript_file)
-        import_statements = self.build_import_statements(task)
-        content_without_header = import_statements + task.code.content
-        content_without_header_hexdigest = hashlib.sha256(
-            content_without_header.encode("utf8")
-        ).hexdigest()
-        if hexdigest == content_without_header_hexdigest:
-            self.logger.info(
-                f'No change in content. Skip saving task "{task.type.__name__}".'
+    def get_task_modules(self, task: TypeScriptBuildTask) -> Set[str]:
+        """
+        Get names of modules affecting the task, following transitive dependencies.
+        """
+        modules = get_type_modules(task.type)
+        visited = {task.type}
+        stack = list(task.get_dependencies())
+        while stack:
+            dependency = stack.pop()
+            if dependency in visited:
+                continue
+            visited.add(dependency)
+            modules |= get_type_modules(dependency)
+            dependency_task = self.type_task_mapping.get(dependency)
+            if dependency_task:
+                stack.extend(dependency_task.get_dependencies())
+        return modules
+
+    def get_affected_tasks(
+        self, changed_files: Iterable[Path]
+    ) -> List[TypeScriptBuildTask]:
+        """
+        Get tasks affected by changed python files.
+
+        Changes of the generator itself affect all tasks. So does any affected task
+        if shared types are enabled, since shared aliases are collected over all tasks.
+        Api clients are affected by any change as viewsets are not tracked.
+        """
+        changed_files = {path.resolve() for path in changed_files}
+        if not changed_files:
+            return []
+        package_dir = Path(django_rest_tsg.__file__).resolve().parent
+        if any(package_dir in path.parents for path in changed_files):
+            return list(self.tasks)
+        module_file_mapping: Dict[str, Optional[Path]] = {}
+        affected = []
+        for task in self.tasks:
+            if task.code_type == TypeScriptCodeType.CLIENT:
+                affected.append(task)
+                continue
+            for module in self.get_task_modules(task):
+                if module not in module_file_mapping:
+                    module_file_mapping[module] = get_module_file(module)
+                if module_file_mapping[module] in changed_files:
+                    affected.append(task)
+                    break
+        if affected and self.shared_types:
+            return list(self.tasks)
+        return affected
+
+    def check_all(
+        self, tasks: Optional[Iterable[TypeScriptBuildTask]] = None
+    ) -> List[Path]:
+        """
+        Get generated files which are missing or out of date, without writing anything.
+        """
+        if tasks is None:
+            tasks = self.tasks
+        if self.shared_types:
+            self.shared_type_mapping = self.collect_shared_types()
+        results = [self.render_and_release(task) for task in tasks]
+        results += self.render_aggregates()
+        return [
+            result.path
+            for result in results
+            if not is_fresh(result.path, result.content)
+        ]
+
+    def render_and_release(self, task: TypeScriptBuildTask) -> TypeScriptBuildResult:
+        result = self.render_task(task)
+        task.release()
+        return result
+
+    def render_task(self, task: TypeScriptBuildTask) -> TypeScriptBuildResult:
+        """
+        Get file path and content without header of task.
+        """
+        build_dir = task.options.get("build_dir", self.build_dir)
+        content, shared_types = self.replace_shared_types(task)
+        extra_imports = {}
+        if shared_types:
+            extra_imports[self.build_dir / SHARED_TYPES_STEM] = shared_types
+        paginated_name = self.get_paginated_name(task)
+        if paginated_name:
+            content += "\n\n" + PAGINATED_ALIAS_TEMPLATE.substitute(
+                name=paginated_name,
+                paginated=PAGINATED_NAME,
+                type=task.get_code().name,
+            )
+            extra_imports[self.build_dir / PAGINATED_STEM] = [PAGINATED_NAME]
+        if task.router is not None and uses_pagination(task.router):
+            if not self.pagination_class:
+                raise BuildException(
+                    f'Client "{task.name}" has paginated list actions. '
+                    "Set pagination_class to generate Paginated<T>."
+                )
+            extra_imports[self.build_dir / PAGINATED_STEM] = [PAGINATED_NAME]
+        converters, runtime_imports = self.build_converters(task)
+        for converter in converters:
+            content += "\n\n" + converter
+        import_statements = self.build_import_statements(
+            task, extra_imports, runtime_imports
+        )
+        # converters are runtime code
+        filename = task.get_filename(self.declaration and not converters)
+        if filename.endswith(".d.ts"):
+            content = content.replace("export const enum", "export declare const enum")
+        dependencies = [
+            self.get_dependency_module(dependency)
+            for dependency in get_imported_dependencies(task, runtime_imports)
+        ]
+        return TypeScriptBuildResult(
+            path=build_dir / filename,
+            content=import_statements + content,
+            source=task.name,
+            dependencies=dependencies + list(extra_imports),
+        )
+
+    def stream_all(
+        self, tasks: Optional[Iterable[TypeScriptBuildTask]] = None
+    ) -> Iterator[dict]:
+        """
+        Yield a record of every generated module as soon as it is rendered.
+
+        Nothing is written. Paths are relative to build directory, while dependencies
+        are imported modules without suffix.
+        """
+        if tasks is None:
+            tasks = self.tasks
+        if self.shared_types:
+            self.shared_type_mapping = self.collect_shared_types()
+        for task in tasks:
+            yield self.get_stream_record(self.render_and_release(task))
+        for result in self.render_aggregates():
+            yield self.get_stream_record(result)
+
+    def get_stream_record(self, result: TypeScriptBuildResult) -> dict:
+        record = self.get_manifest_record(result)
+        record["dependencies"] = [
+            Path(os.path.relpath(module, self.build_dir)).as_posix()
+            for module in result.dependencies
+        ]
+        return record
+
+    def build_converters(
+        self, task: TypeScriptBuildTask
+    ) -> Tuple[List[str], Dict[Type, List[str]]]:
+        """
+        Build enabled converter functions of interface and names imported for them.
+        """
+        converters = []
+        runtime_imports: Dict[Type, List[str]] = {}
+        if task.code_type != TypeScriptCodeType.INTERFACE:
+            return converters, runtime_imports
+        builders = []
+        if self.revivers:
+            builders.append(("revive", build_reviver))
+        if self.mappers:
+            builders.append(("map", build_mapper))
+        if self.validators:
+            builders.append(("validate", build_validator))
+        code = task.get_code()
+        # inherited fields of extending interfaces convert nested values too
+        if code.field_dependencies is None:
+            field_dependencies = code.dependencies
+        else:
+            field_dependencies = code.field_dependencies
+        for prefix, build_converter in builders:
+            content, dependencies = build_converter(
+                task.type, code.name, field_dependencies, self.get_dependency_name
             )
+            if not content:
+                continue
+            converters.append(content)
+            for dependency in dependencies:
+                runtime_imports.setdefault(dependency, []).append(
+                    prefix + self.get_dependency_name(dependency)
+                )
+        return converters, runtime_imports
+
+    def get_tasks_changed_since(
+        self, since: str, config_file: Optional[Path] = None
+    ) -> List[TypeScriptBuildTask]:
+        """
+        Get tasks affected by python files changed since the git ref.
+
+        Changes of config file affect all tasks.
+        """
+        changed_files = get_changed_files(since)
+        if config_file and config_file.resolve() in {
+            path.resolve() for path in changed_files
+        }:
+            return list(self.tasks)
+        tasks = self.get_affected_tasks(changed_files)
+        self.logger.info(f"{len(tasks)} build tasks affected since {since}.")
+        return tasks
+
+    def build_task(self, task: TypeScriptBuildTask) -> TypeScriptBuildResult:
+        result = self.render_task(task)
+        for filename in {task.get_filename(False), task.get_filename(True)}:
+            if filename != result.path.name:
+                self.remove_stale_file(result.path.parent / filename)
+        self.write(result.path, result.content, result.source)
+        return result
+
+    def remove_stale_file(self, typescript_file: Path):
+        """
+        Remove generated file left by the other output mode, which shadows declarations.
+        """
+        if typescript_file.suffix != ".ts" or not typescript_file.exists():
             return
+        if get_digest(typescript_file):
+            typescript_file.unlink()
+            self.logger.info(f'Stale file "{typescript_file}" removed.')
 
-        header = self.build_header(task, content_without_header_hexdigest)
+    def write(self, typescript_file: Path, content_without_header: str, source: str):
+        typescript_file.parent.mkdir(parents=True, exist_ok=True)
+        if is_fresh(typescript_file, content_without_header):
+            self.logger.info(f'No change in content. Skip saving "{source}".')
+            return
+
+        content_without_header_hexdigest = get_content_digest(content_without_header)
+        header = self.build_header(source, content_without_header_hexdigest)
         typescript_file.write_text(header + content_without_header)
         self.logger.debug(
-            f'Typescript code for "{task.type.__name__}" saved as "{typescript_file}".'
+            f'Typescript code for "{source}" saved as "{typescript_file}".'
         )
 
-    def build_header(self, task: TypeScriptBuildTask, hexdigest: str):
+    def build_header(self, source: str, hexdigest: str):
         header = HEADER_TEMPLATE.substitute(
             generator="django-rest-tsg",
             version=VERSION,
-            type=".".join((task.type.__module__, task.type.__qualname__)),
+            type=source,
             date=datetime.now().isoformat(),
             digest=hexdigest,
         )
         header += "\n"
         return header
 
-    def build_import_statements(self, task: TypeScriptBuildTask):
-        result = ""
-        for dependency in task.code.dependencies:
-            dependency_options = self.type_options_mapping.get(dependency, {})
-            if "alias" in dependency_options:
-                dependency_name = dependency_options["alias"]
-            elif issubclass(dependency, Serializer):
-                dependency_name = get_serializer_prefix(dependency)
+    def collect_shared_types(self) -> Dict[str, str]:
+        """
+        Find complex inline types repeated across interfaces.
+        """
+        counter = Counter()
+        for task in self.tasks:
+            if task.code_type != TypeScriptCodeType.INTERFACE:
+                continue
+            for match in INTERFACE_FIELD_PATTERN.finditer(task.get_code().content):
+                representation = match["type"]
+                if is_shareable_type(representation, self.shared_types_threshold):
+                    counter[representation] += 1
+            task.release()
+        return {
+            representation: get_shared_type_name(representation)
+            for representation, count in counter.items()
+            if count > 1
+        }
+
+    def replace_shared_types(self, task: TypeScriptBuildTask):
+        """
+        Replace inline types of task with shared type aliases.
+        """
+        shared_types = set()
+        if (
+            not self.shared_type_mapping
+            or task.code_type != TypeScriptCodeType.INTERFACE
+        ):
+            return task.get_code().content, []
+
+        def replace(match):
+            name = self.shared_type_mapping.get(match["type"])
+            if not name:
+                return match[0]
+            shared_types.add(name)
+            return f"  {match['name']}: {name};"
+
+        content = INTERFACE_FIELD_PATTERN.sub(replace, task.get_code().content)
+        return content, sorted(shared_types)
+
+    def render_shared_types(self) -> TypeScriptBuildResult:
+        shared_types = sorted(
+            self.shared_type_mapping.items(), key=lambda item: item[1]
+        )
+        content = "\n".join(
+            SHARED_TYPE_TEMPLATE.substitute(name=name, type=representation)
+            for representation, name in shared_types
+        )
+        suffix = ".d.ts" if self.declaration else ".ts"
+        return TypeScriptBuildResult(
+            path=self.build_dir / f"{SHARED_TYPES_STEM}{suffix}",
+            content=content,
+            source=SHARED_TYPES_SOURCE,
+        )
+
+    def render_pagination(self) -> TypeScriptBuildResult:
+        code = build_paginated_interface(self.pagination_class)
+        suffix = ".d.ts" if self.declaration else ".ts"
+        return TypeScriptBuildResult(
+            path=self.build_dir / f"{PAGINATED_STEM}{suffix}",
+            content=code.content,
+            source=get_type_name(self.pagination_class),
+        )
+
+    def get_paginated_name(self, task: TypeScriptBuildTask) -> Optional[str]:
+        """
+        Get name of page type alias of task, which serializer tasks have by default.
+        """
+        if not self.pagination_class or task.code_type != TypeScriptCodeType.INTERFACE:
+            return None
+        paginated = task.options.get("paginated", issubclass(task.type, Serializer))
+        if not paginated:
+            return None
+        if isinstance(paginated, str):
+            return paginated
+        return PAGINATED_NAME + task.get_code().name
+
+    def render_aggregates(
+        self, project_references: bool = True
+    ) -> List[TypeScriptBuildResult]:
+        """
+        Render artifacts shared by tasks rather than generated from a single one.
+
+        Project references render every task again to follow its imports.
+        """
+        results = []
+        if self.shared_type_mapping:
+            results.append(self.render_shared_types())
+        if self.pagination_class:
+            results.append(self.render_pagination())
+        if self.project_references and project_references:
+            task_results = [self.render_and_release(task) for task in self.tasks]
+            results += self.render_project_references(task_results + results)
+        return results
+
+    def render_project_references(
+        self, results: Iterable[TypeScriptBuildResult]
+    ) -> List[TypeScriptBuildResult]:
+        """
+        Render a composite tsconfig.json for every build directory.
+
+        Aggregate artifacts form a leaf project of their own, referenced by projects
+        importing them. References follow imports across projects, which must not be
+        circular.
+        """
+        aggregates_project = self.build_dir / AGGREGATES_TSCONFIG_FILENAME
+        aggregate_modules = {
+            self.build_dir / SHARED_TYPES_STEM,
+            self.build_dir / PAGINATED_STEM,
+        }
+
+        def get_project(module: Path) -> Path:
+            if module in aggregate_modules:
+                return aggregates_project
+            return module.parent / TSCONFIG_FILENAME
+
+        def get_reference(project: Path) -> Path:
+            # projects of build directories are referenced by directory
+            return project.parent if project.name == TSCONFIG_FILENAME else project
+
+        files: Dict[Path, List[str]] = {}
+        references: Dict[Path, Set[Path]] = {}
+        for result in results:
+            project = get_project(get_module_path(result.path))
+            files.setdefault(project, []).append(result.path.name)
+            references.setdefault(project, set())
+            for module in result.dependencies:
+                dependency_project = get_project(module)
+                if dependency_project != project:
+                    references[project].add(dependency_project)
+        cycle = find_cycle(references)
+        if cycle:
+            raise BuildException(
+                "Circular imports between build directories: "
+                + " -> ".join(str(get_reference(project)) for project in cycle)
+            )
+        tsconfigs = []
+        for project in sorted(files):
+            directory = project.parent
+            tsconfig = {}
+            if self.tsconfig_extends:
+                tsconfig["extends"] = get_tsconfig_path(
+                    directory, self.tsconfig_extends
+                )
+            tsconfig["compilerOptions"] = {"composite": True}
+            tsconfig["files"] = sorted(files[project])
+            tsconfig["references"] = [
+                {"path": get_tsconfig_path(directory, get_reference(reference))}
+                for reference in sorted(references[project])
+            ]
+            tsconfigs.append(
+                TypeScriptBuildResult(
+                    path=project,
+                    content=json.dumps(tsconfig, indent=2),
+                    source=TSCONFIG_SOURCE,
+                )
+            )
+        return tsconfigs
+
+    def build_aggregates(
+        self, project_references: bool = True
+    ) -> List[TypeScriptBuildResult]:
+        results = self.render_aggregates(project_references)
+        for result in results:
+            name = result.path.name
+            if name.endswith(".d.ts"):
+                stale_name = name[: -len(".d.ts")] + ".ts"
+            elif name.endswith(".ts"):
+                stale_name = name[: -len(".ts")] + ".d.ts"
             else:
-                dependency_name = dependency.__name__
-            dependency_filename = dasherize(underscore(dependency_name))
-            if isinstance(dependency, EnumMeta):
-                dependency_filename += ".enum"
-            build_dir = task.options.get("build_dir", self.build_dir)
-            dependency_build_dir = dependency_options.get("build_dir", self.build_dir)
+                stale_name = None
+            if stale_name:
+                self.remove_stale_file(result.path.parent / stale_name)
+            self.write(result.path, result.content, result.source)
+        return results
+
+    def get_import_template(self):
+        """
+        Dependencies, enums included, only appear in type positions, hence they are
+        imported as types if type-only imports are enabled. Runtime names like
+        converters are imported by values.
+        """
+        if not self.type_only_imports:
+            return IMPORT_TEMPLATE
+        return IMPORT_TYPE_TEMPLATE
+
+    def get_dependency_name(self, dependency: Type) -> str:
+        dependency_options = self.type_options_mapping.get(dependency, {})
+        if "alias" in dependency_options:
+            return dependency_options["alias"]
+        if issubclass(dependency, Serializer):
+            return get_serializer_prefix(dependency)
+        return dependency.__name__
+
+    def get_dependency_module(self, dependency: Type) -> Path:
+        """
+        Get path of generated module of dependency, without suffix.
+        """
+        dependency_options = self.type_options_mapping.get(dependency, {})
+        dependency_filename = dasherize(
+            underscore(self.get_dependency_name(dependency))
+        )
+        if isinstance(dependency, EnumMeta):
+            dependency_filename += ".enum"
+        dependency_build_dir = dependency_options.get("build_dir", self.build_dir)
+        return dependency_build_dir / dependency_filename
+
+    def build_import_statements(
+        self,
+        task: TypeScriptBuildTask,
+        extra_imports: Optional[Dict[Path, List[str]]] = None,
+        runtime_imports: Optional[Dict[Type, List[str]]] = None,
+    ):
+        """
+        Build import statements of dependencies, plus runtime names like revivers.
+        """
+        result = ""
+        build_dir = task.options.get("build_dir", self.build_dir)
+        runtime_imports = runtime_imports or {}
+        for dependency in get_imported_dependencies(task, runtime_imports):
+            dependency_name = self.get_dependency_name(dependency)
             dependency_path = get_relative_path(
-                build_dir / "foobar", dependency_build_dir / dependency_filename
+                build_dir / "foobar", self.get_dependency_module(dependency)
+            )
+            import_template = self.get_import_template()
+            names = [dependency_name]
+            runtime_names = runtime_imports.get(dependency, [])
+            if dependency not in task.get_code().dependencies:
+                # only converters of inherited fields are used
+                import_template, names = IMPORT_TEMPLATE, runtime_names
+            elif import_template is IMPORT_TEMPLATE:
+                names += runtime_names
+            elif runtime_names:
+                result += import_template.substitute(
+                    type=dependency_name, filename=dependency_path
+                )
+                import_template, names = IMPORT_TEMPLATE, runtime_names
+            result += import_template.substitute(
+                type=", ".join(names), filename=dependency_path
             )
-            result += IMPORT_TEMPLATE.substitute(
-                type=dependency_name, filename=dependency_path
+        for module_path, names in (extra_imports or {}).items():
+            import_template = self.get_import_template()
+            result += import_template.substitute(
+                type=", ".join(names),
+                filename=get_relative_path(build_dir / "foobar", module_path),
             )
         if result:
             result += "\n"
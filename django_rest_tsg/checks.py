@@ -0,0 +1,36 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.checks import Warning
+
+
+def check_freshness(app_configs=None, **kwargs):
+    """
+    Check whether generated files are current by fingerprints in TSG_MANIFEST.
+    """
+    manifest = getattr(settings, "TSG_MANIFEST", None)
+    if not manifest:
+        return []
+    # the build module is heavy to import, hence only when checking
+    from django_rest_tsg.build import get_stale_files
+
+    try:
+        stale_files = get_stale_files(Path(manifest))
+    except (OSError, ValueError, KeyError) as e:
+        return [
+            Warning(
+                f"Failed to read TypeScript build manifest: {e}",
+                hint="Run buildtypescript with --manifest.",
+                id="django_rest_tsg.W001",
+            )
+        ]
+    if not stale_files:
+        return []
+    return [
+        Warning(
+            "Generated TypeScript files are stale.",
+            hint="Run buildtypescript. Changed: "
+            + ", ".join(str(path) for path in stale_files),
+            id="django_rest_tsg.W002",
+        )
+    ]
@@ -0,0 +1,163 @@
+from typing import List, Optional, Set, Type
+
+from inflection import camelize, underscore
+from rest_framework.routers import BaseRouter, Route
+from rest_framework.serializers import Serializer
+
+from django_rest_tsg.templates import CLIENT_METHOD_TEMPLATE, CLIENT_TEMPLATE
+from django_rest_tsg.typescript import (
+    PAGINATED_NAME,
+    TypeScriptCode,
+    TypeScriptCodeType,
+    get_registry,
+    get_serializer_prefix,
+)
+
+DEFAULT_CLIENT_NAME = "ApiClient"
+TYPESCRIPT_UNKNOWN = "unknown"
+TYPESCRIPT_VOID = "void"
+QUERY_PARAMETER = "params?: QueryParams"
+LOOKUP_PARAMETER = "lookup: string | number"
+LOOKUP_EXPRESSION = "encodeURIComponent(String(lookup))"
+
+
+def get_serializer_name(serializer_class: Type[Serializer]) -> str:
+    return get_registry().get(serializer_class, get_serializer_prefix(serializer_class))
+
+
+def is_paginated(viewset) -> bool:
+    return getattr(viewset, "pagination_class", None) is not None
+
+
+def uses_pagination(router: BaseRouter) -> bool:
+    """
+    Check whether client of router has paginated list actions.
+    """
+    return any(
+        is_paginated(viewset) and hasattr(viewset, "list")
+        for _, viewset, _ in router.registry
+    )
+
+
+def get_route_path(router: BaseRouter, route: Route, prefix: str) -> str:
+    """
+    Build typescript expression of route path.
+
+    ^{prefix}/{lookup}/foo{trailing_slash}$
+    -> 'users/' + encodeURIComponent(String(lookup)) + '/foo/'
+    """
+    url = route.url.lstrip("^").rstrip("$")
+    url = url.replace("{prefix}", prefix).replace(
+        "{trailing_slash}", router.trailing_slash
+    )
+    expressions = []
+    for index, part in enumerate(url.split("{lookup}")):
+        if index:
+            expressions.append(LOOKUP_EXPRESSION)
+        if part:
+            expressions.append(f"'{part}'")
+    return " + ".join(expressions) or "''"
+
+
+def build_client_method(
+    basename: str,
+    action: str,
+    http_method: str,
+    route: Route,
+    path: str,
+    resource: str,
+    serializer_class: Optional[Type[Serializer]],
+    overloaded: bool,
+    paginated: bool = False,
+) -> str:
+    """
+    Build typescript method calling an action of viewset.
+
+    List actions of paginated viewsets respond with Paginated<T>.
+    """
+    method_name = camelize(
+        f"{underscore(basename).replace('-', '_')}_{action}",
+        uppercase_first_letter=False,
+    )
+    if overloaded:
+        method_name += http_method.capitalize()
+    if serializer_class:
+        data_type = get_serializer_name(serializer_class)
+    else:
+        data_type = TYPESCRIPT_UNKNOWN
+    parameters = []
+    if route.detail:
+        parameters.append(LOOKUP_PARAMETER)
+    if http_method == "get":
+        response_type = data_type
+        if action == "list":
+            if paginated:
+                response_type = f"{PAGINATED_NAME}<{response_type}>"
+            else:
+                response_type += "[]"
+        parameters.append(QUERY_PARAMETER)
+        call = f"this.get<{response_type}>({path}, params)"
+    else:
+        response_type = TYPESCRIPT_VOID if http_method == "delete" else data_type
+        arguments = [f"'{http_method.upper()}'", path, f"'{resource}'"]
+        if http_method == "patch":
+            parameters.append(f"data: Partial<{data_type}>")
+            arguments.append("data")
+        elif http_method in ("post", "put"):
+            parameters.append(f"data: {data_type}")
+            arguments.append("data")
+        call = f"this.send<{response_type}>({', '.join(arguments)})"
+    return CLIENT_METHOD_TEMPLATE.substitute(
+        name=method_name,
+        parameters=", ".join(parameters),
+        type=response_type,
+        call=call,
+    )
+
+
+def build_client(
+    router: BaseRouter, client_name: Optional[str] = None
+) -> TypeScriptCode:
+    """
+    Build typescript api client from django rest framework router.
+
+    GET requests of the client are de-duplicated while in flight and cached by ETag.
+    """
+    if not client_name:
+        client_name = DEFAULT_CLIENT_NAME
+    methods: List[str] = []
+    dependencies: Set[Type] = set()
+    for prefix, viewset, basename in router.registry:
+        resource = f"{prefix}/"
+        for route in router.get_routes(viewset):
+            method_map = router.get_method_map(viewset, route.mapping)
+            if not method_map:
+                continue
+            serializer_class = route.initkwargs.get(
+                "serializer_class", getattr(viewset, "serializer_class", None)
+            )
+            if serializer_class:
+                dependencies.add(serializer_class)
+            path = get_route_path(router, route, prefix)
+            for http_method, action in method_map.items():
+                methods.append(
+                    build_client_method(
+                        basename,
+                        action,
+                        http_method,
+                        route,
+                        path,
+                        resource,
+                        serializer_class,
+                        overloaded=len(method_map) > 1
+                        and len(set(method_map.values())) == 1,
+                        paginated=is_paginated(viewset),
+                    )
+                )
+    return TypeScriptCode(
+        type=TypeScriptCodeType.CLIENT,
+        source=type(router),
+        name=client_name,
+        dependencies=sorted(dependencies, key=lambda tp: tp.__name__),
+        content=CLIENT_TEMPLATE.substitute(name=client_name, methods="".join(methods)),
+    )
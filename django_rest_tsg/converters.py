@@ -0,0 +1,272 @@
+from dataclasses import fields, is_dataclass
+from inspect import isclass
+from typing import (
+    Annotated,
+    Callable,
+    Collection,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from rest_framework.serializers import (
+    DictField,
+    Field,
+    ListField,
+    ListSerializer,
+    Serializer,
+)
+
+from django_rest_tsg.templates import (
+    MAPPER_PROPERTY_TEMPLATE,
+    MAPPER_TEMPLATE,
+    REVIVER_TEMPLATE,
+)
+from django_rest_tsg.typescript import (
+    DRF_FIELD_MAPPING,
+    TRIVIAL_TYPE_MAPPING,
+    TYPESCRIPT_DATE,
+    UNION_TYPES,
+    _get_serializer_field_type,
+    get_property_name,
+)
+
+DATE = "date"
+ARRAY = "array"
+DICT = "dict"
+INDENT = "  "
+
+# Shape of a value: DATE, a nested interface type, (ARRAY, shape), (DICT, shape),
+# or None for values passed through as they are.
+Shape = Union[str, Type, Tuple[str, "Shape"], None]
+
+
+def _container(kind: str, child: Shape) -> Shape:
+    return None if child is None else (kind, child)
+
+
+def get_annotation_shape(tp) -> Shape:
+    """
+    Get shape of a dataclass field annotation.
+
+    Unions of different shapes are passed through.
+    """
+    origin = get_origin(tp)
+    if origin is Annotated:
+        return get_annotation_shape(get_args(tp)[0])
+    if origin is None:
+        if TRIVIAL_TYPE_MAPPING.get(tp) == TYPESCRIPT_DATE:
+            return DATE
+        if isclass(tp) and is_dataclass(tp):
+            return tp
+        return None
+    args = get_args(tp)
+    if origin in UNION_TYPES:
+        shapes = {get_annotation_shape(arg) for arg in args if arg is not type(None)}
+        return shapes.pop() if len(shapes) == 1 else None
+    if origin in (list, tuple) and args:
+        return _container(ARRAY, get_annotation_shape(args[0]))
+    if origin is dict and len(args) == 2:
+        return _container(DICT, get_annotation_shape(args[1]))
+    return None
+
+
+def get_serializer_field_shape(field: Field) -> Shape:
+    """
+    Get shape of a serializer field, following the dependencies of its interface type.
+    """
+    if isinstance(field, ListField):
+        return _container(ARRAY, get_serializer_field_shape(field.child))
+    if isinstance(field, DictField):
+        return _container(DICT, get_serializer_field_shape(field.child))
+    if DRF_FIELD_MAPPING.get(type(field)) == TYPESCRIPT_DATE:
+        return DATE
+    if isinstance(field, ListSerializer):
+        return (ARRAY, type(field.child))
+    if not isinstance(field, Serializer):
+        return None
+    _, dependency = _get_serializer_field_type(field)
+    return dependency
+
+
+def get_field_shapes(tp: Type) -> List[Tuple[str, str, Shape]]:
+    """
+    Get python name, typescript name and shape of every field of serializer or dataclass.
+    """
+    if isclass(tp) and issubclass(tp, Serializer):
+        items = [
+            (name, get_serializer_field_shape(field))
+            for name, field in tp().get_fields().items()
+        ]
+    elif is_dataclass(tp):
+        items = [(field.name, get_annotation_shape(field.type)) for field in fields(tp)]
+    else:
+        return []
+    return [(name, get_property_name(name), shape) for name, shape in items]
+
+
+def needs_revival(tp: Type, visited: Optional[Set[Type]] = None) -> bool:
+    """
+    Check whether the interface of type has date values, directly or nested.
+    """
+    if visited is None:
+        visited = set()
+    if tp in visited:
+        return False
+    visited.add(tp)
+    return any(
+        _shape_needs_revival(shape, visited) for _, _, shape in get_field_shapes(tp)
+    )
+
+
+def _shape_needs_revival(shape: Shape, visited: Set[Type]) -> bool:
+    if shape is None:
+        return False
+    if shape == DATE:
+        return True
+    if isinstance(shape, tuple):
+        return _shape_needs_revival(shape[1], visited)
+    return needs_revival(shape, visited)
+
+
+def _prune_shape(
+    shape: Shape, keep: Callable[[Type], bool], dates: bool = True
+) -> Shape:
+    if shape is None or shape == DATE:
+        return shape if dates else None
+    if isinstance(shape, tuple):
+        return _container(shape[0], _prune_shape(shape[1], keep, dates))
+    return shape if keep(shape) else None
+
+
+def _build_revival(
+    expression: str, shape: Shape, get_name: Callable[[Type], str], depth: int = 0
+) -> List[str]:
+    """
+    Build statements reviving dates of a non-null value in place.
+    """
+    if shape == DATE:
+        return [f"{expression} = new Date({expression});"]
+    if not isinstance(shape, tuple):
+        return [f"revive{get_name(shape)}({expression});"]
+    kind, child = shape
+    if kind == ARRAY:
+        index = f"i{depth}"
+        loop = f"for (let {index} = 0; {index} < {expression}.length; {index}++) {{"
+    else:
+        index = f"k{depth}"
+        loop = f"for (const {index} in {expression}) {{"
+    item = f"{expression}[{index}]"
+    body = _guard(item, _build_revival(item, child, get_name, depth + 1))
+    return [loop, *(INDENT + line for line in body), "}"]
+
+
+def _guard(expression: str, statements: List[str]) -> List[str]:
+    if len(statements) == 1:
+        return [f"if ({expression} != null) {statements[0]}"]
+    return [
+        f"if ({expression} != null) {{",
+        *(INDENT + line for line in statements),
+        "}",
+    ]
+
+
+def build_reviver(
+    tp: Type,
+    interface_name: str,
+    dependencies: Collection[Type],
+    get_name: Callable[[Type], str],
+) -> Tuple[str, List[Type]]:
+    """
+    Build typescript function reviving dates of interface in place.
+
+    Only known date paths are visited, calling revivers of nested interfaces.
+    Empty content is returned if there is nothing to revive. A reviver is emitted
+    whenever callers may call it, even if its nested dates are not reachable here,
+    e.g. behind a registered type.
+    """
+    revived_dependencies = set()
+
+    def keep(dependency: Type) -> bool:
+        if dependency in dependencies and needs_revival(dependency):
+            revived_dependencies.add(dependency)
+            return True
+        return False
+
+    statements = []
+    for _, name, shape in get_field_shapes(tp):
+        shape = _prune_shape(shape, keep)
+        if shape is None:
+            continue
+        expression = f"data.{name}"
+        statements += _guard(expression, _build_revival(expression, shape, get_name))
+    if not statements and not needs_revival(tp):
+        return "", []
+    content = REVIVER_TEMPLATE.substitute(
+        name=interface_name,
+        statements="".join(INDENT + line + "\n" for line in statements),
+    )
+    return content, sorted(revived_dependencies, key=lambda tp: tp.__name__)
+
+
+def _build_mapping(
+    expression: str, shape: Shape, get_name: Callable[[Type], str], depth: int = 0
+) -> str:
+    """
+    Build typescript expression mapping keys of a value to interface property names.
+    """
+    if shape is None:
+        return expression
+    if not isinstance(shape, tuple):
+        mapping = f"map{get_name(shape)}({expression})"
+    else:
+        kind, child = shape
+        item = f"v{depth}"
+        item_mapping = _build_mapping(item, child, get_name, depth + 1)
+        if kind == ARRAY:
+            mapping = f"{expression}.map(({item}: any) => {item_mapping})"
+        else:
+            key = f"k{depth}"
+            mapping = (
+                f"Object.fromEntries(Object.entries({expression}).map("
+                f"([{key}, {item}]: [string, any]) => [{key}, {item_mapping}]))"
+            )
+    return f"{expression} == null ? {expression} : {mapping}"
+
+
+def build_mapper(
+    tp: Type,
+    interface_name: str,
+    dependencies: Collection[Type],
+    get_name: Callable[[Type], str],
+) -> Tuple[str, List[Type]]:
+    """
+    Build typescript function mapping python field names to interface property names.
+
+    Keys are looked up statically, calling mappers of nested interfaces.
+    """
+    mapped_dependencies = set()
+
+    def keep(dependency: Type) -> bool:
+        if dependency in dependencies:
+            mapped_dependencies.add(dependency)
+            return True
+        return False
+
+    properties = []
+    for key, name, shape in get_field_shapes(tp):
+        shape = _prune_shape(shape, keep, dates=False)
+        properties.append(
+            MAPPER_PROPERTY_TEMPLATE.substitute(
+                name=name, value=_build_mapping(f"data.{key}", shape, get_name)
+            )
+        )
+    content = MAPPER_TEMPLATE.substitute(
+        name=interface_name, properties="\n".join(properties)
+    )
+    return content, sorted(mapped_dependencies, key=lambda tp: tp.__name__)
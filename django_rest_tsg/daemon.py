@@ -0,0 +1,165 @@
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Optional
+
+if TYPE_CHECKING:
+    from django_rest_tsg.build import TypeScriptBuilder
+
+# The client is expected to run without django, so nothing from django is imported here.
+
+COMMANDS = ("build", "check", "ping", "shutdown")
+RESTART_TIMEOUT = 60
+RETRY_INTERVAL = 0.1
+
+
+class TypeScriptBuildRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Each request and response is a JSON object in a single line.
+    """
+
+    def handle(self):
+        try:
+            response = self.server.dispatch(json.loads(self.rfile.readline()))
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        self.wfile.write(json.dumps(response).encode("utf8") + b"\n")
+
+
+class TypeScriptBuildServer(socketserver.UnixStreamServer):
+    """
+    Build server keeping django and generated tasks resident.
+
+    Requests are served one at a time. Changes of the config file reload the config,
+    while changes of other source files restart the server, after which the client
+    retries its request.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        load_builder: Callable[..., "TypeScriptBuilder"],
+        config_file: Optional[Path] = None,
+    ):
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, TypeScriptBuildRequestHandler)
+        self.socket_path = socket_path
+        self.load_builder = load_builder
+        self.config_file = config_file.resolve() if config_file else None
+        self.restart = False
+        self.builder = load_builder()
+        self.mtimes = self.get_mtimes()
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def get_mtimes(self) -> Dict[Path, float]:
+        from django_rest_tsg.build import get_module_file
+
+        modules = set()
+        for task in self.builder.tasks:
+            modules |= self.builder.get_task_modules(task)
+        files = {get_module_file(module) for module in modules}
+        if self.config_file:
+            files.add(self.config_file)
+        return {
+            file: file.stat().st_mtime for file in files if file and file.exists()
+        }
+
+    def get_changed_files(self):
+        changed_files = set()
+        for file, mtime in self.mtimes.items():
+            if not file.exists() or file.stat().st_mtime != mtime:
+                changed_files.add(file)
+        return changed_files
+
+    def stop(self):
+        threading.Thread(target=self.shutdown).start()
+
+    def dispatch(self, request: dict) -> dict:
+        command = request.get("command")
+        if command not in COMMANDS:
+            return {"ok": False, "error": f"Unknown command: {command}"}
+        if command == "ping":
+            return {"ok": True}
+        if command == "shutdown":
+            self.stop()
+            return {"ok": True}
+        changed_files = self.get_changed_files()
+        if changed_files - {self.config_file}:
+            self.restart = True
+            self.stop()
+            return {"ok": False, "restart": True}
+        if changed_files:
+            self.builder = self.load_builder(reload=True)
+            self.mtimes = self.get_mtimes()
+        tasks = None
+        since = request.get("since")
+        if since:
+            tasks = self.builder.get_tasks_changed_since(since, self.config_file)
+        if command == "check":
+            stale_files = self.builder.check_all(tasks)
+            return {"ok": not stale_files, "stale": [str(f) for f in stale_files]}
+        tasks = list(self.builder.tasks if tasks is None else tasks)
+        self.builder.build_all(tasks)
+        return {"ok": True, "tasks": len(tasks)}
+
+
+def send_request(socket_path: str, request: dict) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps(request).encode("utf8") + b"\n")
+        with client.makefile("rb") as f:
+            return json.loads(f.readline())
+
+
+def request(socket_path: str, payload: dict, timeout: float = RESTART_TIMEOUT) -> dict:
+    """
+    Send request to build server, retrying while the server restarts.
+    """
+    response = send_request(socket_path, payload)
+    deadline = time.monotonic() + timeout
+    while response.get("restart"):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Build server on {socket_path} did not restart.")
+        time.sleep(RETRY_INTERVAL)
+        try:
+            response = send_request(socket_path, payload)
+        except (ConnectionError, FileNotFoundError, ValueError):
+            # the old server may be gone before the new one listens
+            continue
+    return response
+
+
+def main(argv=None) -> int:
+    parser = ArgumentParser(
+        prog="python -m django_rest_tsg.daemon",
+        description="Thin client of buildtypescript --serve.",
+    )
+    parser.add_argument("socket", type=str)
+    parser.add_argument("command", choices=COMMANDS, nargs="?", default="build")
+    parser.add_argument("--since", type=str)
+    args = parser.parse_args(argv)
+    payload = {"command": args.command}
+    if args.since:
+        payload["since"] = args.since
+    try:
+        response = request(args.socket, payload)
+    except (OSError, TimeoutError) as e:
+        print(f"Failed to reach build server: {e}", file=sys.stderr)
+        return 2
+    print(json.dumps(response))
+    return 0 if response.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
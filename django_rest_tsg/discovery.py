@@ -0,0 +1,246 @@
+import ast
+import importlib
+import json
+import os
+from dataclasses import is_dataclass
+from enum import EnumMeta
+from inspect import isclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Type
+
+from django.apps import apps
+from rest_framework.serializers import ListSerializer, ModelSerializer, Serializer
+from rest_framework_dataclasses.serializers import DataclassSerializer
+
+from django_rest_tsg import VERSION
+from django_rest_tsg.build import TypeScriptBuildOptions, TypeScriptBuildTask, build
+from django_rest_tsg.typescript import LIBRARY_PACKAGES, get_registry
+
+SERIALIZER_SUFFIX = "Serializer"
+ENUM_BASES = {
+    "Enum",
+    "IntEnum",
+    "StrEnum",
+    "Flag",
+    "IntFlag",
+    "Choices",
+    "IntegerChoices",
+    "TextChoices",
+}
+REGISTER_NAME = "register"
+SKIPPED_DIRECTORIES = {"migrations", "__pycache__", "node_modules"}
+SKIPPED_PACKAGES = ("django", "django_rest_tsg", *LIBRARY_PACKAGES)
+
+# Index of a module file: its mtime, module name, top-level classes in source order as
+# (name, base names, decorator names), and names passed to register() calls.
+ModuleIndex = dict
+
+# in-memory index shared by discoveries of the same process, by file path
+DISCOVERY_INDEX: Dict[str, ModuleIndex] = {}
+
+
+def _get_terminal_name(node: ast.AST) -> Optional[str]:
+    """
+    foo.bar.Baz -> Baz, register(...) -> register, Generic[T] -> Generic
+    """
+    if isinstance(node, ast.Call):
+        return _get_terminal_name(node.func)
+    if isinstance(node, ast.Subscript):
+        return _get_terminal_name(node.value)
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    if isinstance(node, ast.Name):
+        return node.id
+    return None
+
+
+def index_module(path: Path, module_name: str) -> ModuleIndex:
+    """
+    Index top-level classes of module file by parsing it, without importing it.
+    """
+    classes = []
+    registered = []
+    try:
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+    except (SyntaxError, ValueError):
+        tree = ast.Module(body=[], type_ignores=[])
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes.append(
+                [
+                    node.name,
+                    [_get_terminal_name(base) for base in node.bases],
+                    [
+                        _get_terminal_name(decorator)
+                        for decorator in node.decorator_list
+                    ],
+                ]
+            )
+        elif (
+            isinstance(node, ast.Expr)
+            and isinstance(node.value, ast.Call)
+            and _get_terminal_name(node.value) == REGISTER_NAME
+            and node.value.args
+            and isinstance(node.value.args[0], ast.Name)
+        ):
+            registered.append(node.value.args[0].id)
+    return {
+        "mtime": path.stat().st_mtime_ns,
+        "module": module_name,
+        "classes": classes,
+        "registered": registered,
+    }
+
+
+def iter_app_modules(app_labels: Optional[Iterable[str]] = None):
+    """
+    Iterate path and module name of python files of installed apps.
+
+    Django and packages of django rest framework are skipped unless their labels are
+    specified.
+    """
+    if app_labels is None:
+        app_configs = [
+            app_config
+            for app_config in apps.get_app_configs()
+            if app_config.name.partition(".")[0] not in SKIPPED_PACKAGES
+        ]
+    else:
+        app_configs = [apps.get_app_config(label) for label in app_labels]
+    for app_config in app_configs:
+        app_path = Path(app_config.path)
+        for directory, directories, filenames in os.walk(app_path):
+            directories[:] = sorted(
+                name
+                for name in directories
+                if name not in SKIPPED_DIRECTORIES and not name.startswith(".")
+            )
+            parts = Path(directory).relative_to(app_path).parts
+            for filename in sorted(filenames):
+                if not filename.endswith(".py"):
+                    continue
+                stem = filename[:-3]
+                names = [app_config.name, *parts]
+                if stem != "__init__":
+                    names.append(stem)
+                yield Path(directory) / filename, ".".join(names)
+
+
+def load_index(
+    app_labels: Optional[Iterable[str]] = None, index_file: Optional[Path] = None
+) -> Dict[str, ModuleIndex]:
+    """
+    Get index of modules of installed apps, parsing only files changed since indexed.
+    """
+    if index_file and not DISCOVERY_INDEX:
+        try:
+            index = json.loads(index_file.read_text())
+            if index.get("version") == VERSION:
+                DISCOVERY_INDEX.update(index["modules"])
+        except (OSError, ValueError, KeyError):
+            pass
+    modules = {}
+    changed = False
+    for path, module_name in iter_app_modules(app_labels):
+        key = str(path)
+        entry = DISCOVERY_INDEX.get(key)
+        if (
+            entry is None
+            or entry["mtime"] != path.stat().st_mtime_ns
+            or entry["module"] != module_name
+        ):
+            entry = DISCOVERY_INDEX[key] = index_module(path, module_name)
+            changed = True
+        modules[key] = entry
+    if index_file and changed:
+        index_file.parent.mkdir(parents=True, exist_ok=True)
+        index_file.write_text(
+            json.dumps({"version": VERSION, "modules": DISCOVERY_INDEX})
+        )
+    return modules
+
+
+def find_candidates(modules: Iterable[ModuleIndex]) -> Dict[str, List[str]]:
+    """
+    Find names of classes possibly being build targets by module.
+
+    Bases are matched by names, following subclasses of candidates across modules.
+    """
+    modules = list(modules)
+    names: Set[str] = set()
+    changed = True
+    while changed:
+        changed = False
+        for entry in modules:
+            for name, bases, decorators in entry["classes"]:
+                if name in names:
+                    continue
+                if (
+                    any(
+                        base in names
+                        or base in ENUM_BASES
+                        or (base and base.endswith(SERIALIZER_SUFFIX))
+                        for base in bases
+                    )
+                    or REGISTER_NAME in decorators
+                    or name in entry["registered"]
+                ):
+                    names.add(name)
+                    changed = True
+    candidates = {}
+    for entry in modules:
+        classes = [name for name, _, _ in entry["classes"] if name in names]
+        if classes:
+            candidates[entry["module"]] = classes
+    return candidates
+
+
+def is_build_target(tp, module_name: str) -> bool:
+    """
+    Check whether class defined in module is a concrete serializer, an enum with
+    members, or a registered dataclass.
+    """
+    if not isclass(tp) or tp.__module__ != module_name:
+        return False
+    if isinstance(tp, EnumMeta):
+        return len(tp) > 0
+    if is_dataclass(tp):
+        return tp in get_registry().types
+    if not issubclass(tp, Serializer) or issubclass(tp, ListSerializer):
+        return False
+    return not (
+        issubclass(tp, (ModelSerializer, DataclassSerializer))
+        and not hasattr(tp, "Meta")
+    )
+
+
+def discover_tasks(
+    app_labels: Optional[Iterable[str]] = None,
+    index_file: Optional[Path] = None,
+    tasks: Iterable[TypeScriptBuildTask] = (),
+    options: Optional[TypeScriptBuildOptions] = None,
+    lazy: Optional[bool] = None,
+) -> List[TypeScriptBuildTask]:
+    """
+    Discover serializers, enums and registered dataclasses of installed apps as tasks.
+
+    Only modules whose classes may be targets are imported, found by an index of
+    parsed modules which is cached by mtime, in memory and optionally in index file.
+    Given tasks take precedence over discovered tasks of the same types. Types
+    registered with a name are aliased by it.
+    """
+    tasks = list(tasks)
+    types: Set[Type] = {task.type for task in tasks}
+    modules = load_index(app_labels, index_file).values()
+    for module_name, names in find_candidates(modules).items():
+        module = importlib.import_module(module_name)
+        for name in names:
+            tp = getattr(module, name, None)
+            if is_build_target(tp, module_name) and tp not in types:
+                types.add(tp)
+                task_options = dict(options or {})
+                registered_name = get_registry().types.get(tp)
+                if registered_name:
+                    task_options.setdefault("alias", registered_name)
+                tasks.append(build(tp, task_options, lazy=lazy))
+    return tasks
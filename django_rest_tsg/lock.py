@@ -0,0 +1,96 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Iterable, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # advisory locking is unavailable on windows
+    fcntl = None
+
+LOCK_FILENAME = ".tsg.lock"
+STATE_FILENAME = ".tsg-state.json"
+FULL_BUILD_KEY = "all"
+
+
+class BuildLock:
+    """
+    Advisory lock of build directory shared by concurrent invocations.
+
+    Invocations wait for the running build. A build requested before another one
+    started is covered by it, so waiting invocations coalesce into one follow-up build.
+    So is a build requested while another one was running, if its sources have not
+    changed since then, e.g. of another process which loaded sources before waiting.
+    """
+
+    def __init__(self, directory: Path):
+        self.lock_file = directory / LOCK_FILENAME
+        self.state_file = directory / STATE_FILENAME
+        self.fd = None
+
+    def __enter__(self) -> "BuildLock":
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        self.fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if fcntl is not None:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+        os.close(self.fd)
+        self.fd = None
+
+    def get_state(self) -> dict:
+        try:
+            return json.loads(self.state_file.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def is_covered(
+        self,
+        requested: float,
+        key: str = FULL_BUILD_KEY,
+        sources: Iterable[Path] = (),
+    ) -> bool:
+        """
+        Check whether the last build of the same tasks or all tasks started after the
+        request, or finished after it and started after the last change of sources.
+        """
+        state = self.get_state()
+        if state.get("key") not in (key, FULL_BUILD_KEY):
+            return False
+        started = state.get("started", 0)
+        if started >= requested:
+            return True
+        if state.get("finished", 0) < requested:
+            return False
+        sources = list(sources)
+        return bool(sources) and all(get_mtime(source) < started for source in sources)
+
+    def record(
+        self,
+        started: float,
+        key: str = FULL_BUILD_KEY,
+        finished: Optional[float] = None,
+    ):
+        state = {
+            "started": started,
+            "finished": time.time() if finished is None else finished,
+            "key": key,
+        }
+        temporary_file = self.state_file.with_name(f"{self.state_file.name}.tmp")
+        temporary_file.write_text(json.dumps(state))
+        os.replace(temporary_file, self.state_file)
+
+
+def get_mtime(path: Path) -> float:
+    """
+    Get modification time of file, infinite if missing, as it may have been moved.
+    """
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return float("inf")
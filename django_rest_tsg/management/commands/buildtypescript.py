@@ -1,10 +1,23 @@
 import importlib
+import json
 import os
+import sys
+import time
 from pathlib import Path
+from typing import Optional
 
 from django.core.management import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+from rest_framework.settings import api_settings
 
-from django_rest_tsg.build import TypeScriptBuilder, TypeScriptBuilderConfig
+from django_rest_tsg.build import (
+    BuildException,
+    TypeScriptBuilder,
+    TypeScriptBuilderConfig,
+    lazy_tasks,
+    parse_shard,
+)
+from django_rest_tsg.daemon import TypeScriptBuildServer
 
 
 class Command(BaseCommand):
@@ -13,20 +26,196 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument("package", nargs="?", type=str)
         parser.add_argument("--build-dir", type=str)
+        parser.add_argument(
+            "--declaration",
+            action="store_true",
+            help="Write declaration files for interface-only tasks.",
+        )
+        parser.add_argument(
+            "--format",
+            choices=("files", "ndjson"),
+            default="files",
+            help="Write files, or stream a JSON record per module to stdout "
+            "without writing anything.",
+        )
+        parser.add_argument(
+            "--lock",
+            action="store_true",
+            help="Lock build directory, coalescing concurrent builds into one.",
+        )
+        parser.add_argument(
+            "--manifest",
+            type=str,
+            help="Write fingerprint manifest for freshness checks.",
+        )
+        parser.add_argument(
+            "--since",
+            type=str,
+            help="Rebuild only tasks affected by python files changed since the git ref.",
+        )
+        parser.add_argument(
+            "--metadata",
+            type=str,
+            help="Write OPTIONS metadata of serializers for StaticMetadata.",
+        )
+        parser.add_argument(
+            "--shard",
+            type=str,
+            metavar="INDEX/COUNT",
+            help="Build only a shard of tasks, e.g. 1/4, and write its manifest. "
+            "Tasks of config are built lazily.",
+        )
+        parser.add_argument(
+            "--shard-manifest",
+            type=str,
+            help="Path of shard manifest, tsg-shard-INDEX-of-COUNT.json by default.",
+        )
+        parser.add_argument(
+            "--merge",
+            type=str,
+            nargs="+",
+            metavar="MANIFEST",
+            help="Merge shard manifests into build directory.",
+        )
+        parser.add_argument(
+            "--costs",
+            type=str,
+            help="Per-task cost file balancing shards, which is written on merging.",
+        )
+        parser.add_argument(
+            "--serve",
+            type=str,
+            metavar="SOCKET",
+            help="Serve build requests over a unix domain socket.",
+        )
 
     def handle(self, *args, **options):
         package_option = options.get("package")
-        build_dir_option = options.get("build_dir")
         if not package_option:
             package_option = os.environ.get("DJANGO_SETTINGS_MODULE").rpartition(".")[0]
-        module = importlib.import_module(package_option + ".tsgconfig")
-        build_dir: Path = getattr(module, "BUILD_DIR", build_dir_option)
+        module_name = package_option + ".tsgconfig"
+        loaded = time.time()
+        if options.get("shard"):
+            # tasks of other shards are never generated
+            with lazy_tasks():
+                if module_name in sys.modules:
+                    module = importlib.reload(sys.modules[module_name])
+                else:
+                    module = importlib.import_module(module_name)
+                builder = TypeScriptBuilder(self.get_config(module, options, loaded))
+            try:
+                self.build_shard(builder, options)
+            except BuildException as e:
+                raise CommandError(str(e))
+            return
+        module = importlib.import_module(module_name)
+        config_file = Path(module.__file__)
+        if options.get("serve"):
+            self.serve(options["serve"], module, options, loaded)
+            return
+        builder = TypeScriptBuilder(self.get_config(module, options, loaded))
+        if options.get("merge"):
+            try:
+                self.merge(builder, options)
+            except BuildException as e:
+                raise CommandError(str(e))
+            return
+        tasks = None
+        since = options.get("since")
+        if since:
+            try:
+                tasks = builder.get_tasks_changed_since(since, config_file)
+            except BuildException as e:
+                raise CommandError(str(e))
+        try:
+            if options.get("format") == "ndjson":
+                self.stream(builder, tasks)
+                return
+            builder.build_all(tasks)
+        except BuildException as e:
+            raise CommandError(str(e))
+
+    def get_config(
+        self, module, options, loaded: Optional[float] = None
+    ) -> TypeScriptBuilderConfig:
+        build_dir: Path = getattr(module, "BUILD_DIR", options.get("build_dir"))
         if isinstance(build_dir, str):
             build_dir = Path(build_dir)
         if not build_dir:
             raise CommandError("No build_dir is specified.")
-        config = TypeScriptBuilderConfig(
-            tasks=getattr(module, "BUILD_TASKS", []), build_dir=build_dir
+        manifest = options.get("manifest") or getattr(module, "MANIFEST", None)
+        metadata = options.get("metadata") or getattr(module, "METADATA", None)
+        # pages of DRF default pagination, unless configured otherwise
+        pagination_class = getattr(
+            module, "PAGINATION_CLASS", api_settings.DEFAULT_PAGINATION_CLASS
+        )
+        tsconfig_extends = getattr(module, "TSCONFIG_EXTENDS", None)
+        if isinstance(pagination_class, str):
+            pagination_class = import_string(pagination_class)
+        return TypeScriptBuilderConfig(
+            tasks=getattr(module, "BUILD_TASKS", []),
+            build_dir=build_dir,
+            shared_types=getattr(module, "SHARED_TYPES", False),
+            shared_types_threshold=getattr(module, "SHARED_TYPES_THRESHOLD", 24),
+            type_only_imports=getattr(module, "TYPE_ONLY_IMPORTS", False),
+            declaration=options.get("declaration")
+            or getattr(module, "DECLARATION", False),
+            revivers=getattr(module, "REVIVERS", False),
+            mappers=getattr(module, "MAPPERS", False),
+            validators=getattr(module, "VALIDATORS", False),
+            pagination_class=pagination_class,
+            project_references=getattr(module, "PROJECT_REFERENCES", False),
+            tsconfig_extends=Path(tsconfig_extends) if tsconfig_extends else None,
+            lock=options.get("lock") or getattr(module, "LOCK", False),
+            manifest=Path(manifest) if manifest else None,
+            metadata=Path(metadata) if metadata else None,
+            dependency_closure=getattr(module, "DEPENDENCY_CLOSURE", False),
+            config_file=Path(module.__file__),
+            loaded=loaded,
+        )
+
+    def stream(self, builder: TypeScriptBuilder, tasks=None):
+        for record in builder.stream_all(tasks):
+            self.stdout.write(json.dumps(record))
+            self.stdout.flush()
+
+    def build_shard(self, builder: TypeScriptBuilder, options):
+        index, count = parse_shard(options["shard"])
+        costs = None
+        if options.get("costs") and Path(options["costs"]).exists():
+            costs = json.loads(Path(options["costs"]).read_text())
+        manifest = builder.build_shard(index, count, costs)
+        manifest_path = options.get("shard_manifest")
+        if not manifest_path:
+            manifest_path = f"tsg-shard-{index}-of-{count}.json"
+        Path(manifest_path).write_text(json.dumps(manifest))
+
+    def merge(self, builder: TypeScriptBuilder, options):
+        manifests = [json.loads(Path(path).read_text()) for path in options["merge"]]
+        costs = builder.merge_shards(manifests)
+        if options.get("costs"):
+            Path(options["costs"]).write_text(
+                json.dumps(costs, indent=2, sort_keys=True)
+            )
+
+    def serve(self, socket_path: str, module, options, loaded: float):
+        def load_builder(reload: bool = False) -> TypeScriptBuilder:
+            nonlocal loaded
+            if reload:
+                loaded = time.time()
+                importlib.reload(module)
+            return TypeScriptBuilder(self.get_config(module, options, loaded))
+
+        server = TypeScriptBuildServer(
+            socket_path, load_builder, config_file=Path(module.__file__)
         )
-        builder = TypeScriptBuilder(config)
-        builder.build_all()
+        self.stdout.write(f"Serving build requests on {socket_path}.")
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+        if server.restart:
+            self.stdout.write("Source changed. Restarting...")
+            # orig_argv keeps "-m" of "python -m django"
+            argv = getattr(sys, "orig_argv", [sys.executable] + sys.argv)
+            os.execv(sys.executable, argv)
@@ -0,0 +1,62 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Type
+
+from django.conf import settings
+from django.utils.translation import get_language
+from rest_framework.metadata import SimpleMetadata
+from rest_framework.serializers import Serializer
+
+from django_rest_tsg.build import get_type_name
+
+
+class StaticMetadataCache:
+    """
+    Serializer infos of a metadata artifact written by buildtypescript.
+
+    Infos are looked up by type name once per serializer class.
+    """
+
+    def __init__(self, path: Path):
+        try:
+            artifact = json.loads(path.read_text())
+        except (OSError, ValueError):
+            artifact = {}
+        self.language: Optional[str] = artifact.get("language")
+        self.serializers: Dict[str, dict] = artifact.get("serializers", {})
+        self.infos: Dict[Type[Serializer], Optional[dict]] = {}
+
+    def get(self, serializer_class: Type[Serializer]) -> Optional[dict]:
+        try:
+            return self.infos[serializer_class]
+        except KeyError:
+            info = self.serializers.get(get_type_name(serializer_class))
+            self.infos[serializer_class] = info
+            return info
+
+
+@lru_cache(maxsize=None)
+def get_static_metadata_cache(path: str) -> StaticMetadataCache:
+    return StaticMetadataCache(Path(path))
+
+
+class StaticMetadata(SimpleMetadata):
+    """
+    Metadata serving serializer infos precomputed at build time from TSG_METADATA.
+
+    Serializers absent from the artifact, or requests in another language than the
+    one of the build, fall back to dynamic metadata.
+    """
+
+    def get_serializer_info(self, serializer):
+        if hasattr(serializer, "child"):
+            # list serializers are described by their child
+            serializer = serializer.child
+        path = getattr(settings, "TSG_METADATA", None)
+        if path:
+            cache = get_static_metadata_cache(str(path))
+            info = cache.get(type(serializer))
+            if info is not None and cache.language == get_language():
+                return info
+        return super().get_serializer_info(serializer)
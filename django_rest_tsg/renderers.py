@@ -0,0 +1,140 @@
+from typing import Any, Dict, Optional, Tuple, Type, Union
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.serializers import (
+    DictField,
+    Field,
+    ListField,
+    ListSerializer,
+    Serializer,
+)
+
+from django_rest_tsg.typescript import get_property_name
+
+DICT = "dict"
+
+# Key plan of serializer: field name -> (property name, plan of nested value).
+# Plan of nested value is a key plan, (DICT, plan) for values of dict, or None.
+KeyPlan = Dict[str, Tuple[str, Any]]
+ValuePlan = Union[KeyPlan, Tuple[str, Any], None]
+
+KEY_PLANS: Dict[Type[Serializer], KeyPlan] = {}
+
+
+def _build_value_plan(field: Field, plans: Dict[Type[Serializer], KeyPlan]):
+    if isinstance(field, ListField):
+        return _build_value_plan(field.child, plans)
+    if isinstance(field, DictField):
+        child = _build_value_plan(field.child, plans)
+        return None if child is None else (DICT, child)
+    if isinstance(field, ListSerializer):
+        return _build_key_plan(type(field.child), plans)
+    if isinstance(field, Serializer):
+        return _build_key_plan(type(field), plans)
+    return None
+
+
+def _build_key_plan(
+    serializer_class: Type[Serializer], plans: Dict[Type[Serializer], KeyPlan]
+) -> KeyPlan:
+    if serializer_class in KEY_PLANS:
+        return KEY_PLANS[serializer_class]
+    if serializer_class in plans:
+        # recursive serializers share the plan being built
+        return plans[serializer_class]
+    plan = plans[serializer_class] = {}
+    for field_name, field in serializer_class().get_fields().items():
+        plan[field_name] = (
+            get_property_name(field_name),
+            _build_value_plan(field, plans),
+        )
+    return plan
+
+
+def get_key_plan(serializer_class: Type[Serializer]) -> KeyPlan:
+    """
+    Get key plan of serializer, which is computed once per serializer class.
+
+    Property names are the same as the ones of generated interfaces.
+    """
+    plan = KEY_PLANS.get(serializer_class)
+    if plan is None:
+        plans = {}
+        plan = _build_key_plan(serializer_class, plans)
+        # publish complete plans only, so other threads never see partial ones
+        KEY_PLANS.update(plans)
+    return plan
+
+
+def apply_value_plan(data, plan: ValuePlan):
+    """
+    Rename keys of serialized data by plan, without any case conversion.
+
+    Keys absent from plan are kept as they are.
+    """
+    if plan is None or data is None:
+        return data
+    if isinstance(data, list):
+        return [apply_value_plan(item, plan) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if isinstance(plan, tuple):
+        return {key: apply_value_plan(value, plan[1]) for key, value in data.items()}
+    result = {}
+    for key, value in data.items():
+        entry = plan.get(key)
+        if entry is None:
+            result[key] = value
+        else:
+            name, child = entry
+            result[name] = value if child is None else apply_value_plan(value, child)
+    return result
+
+
+def get_data_serializer_class(data) -> Optional[Type[Serializer]]:
+    """
+    Get serializer class of ReturnDict or ReturnList.
+    """
+    serializer = getattr(data, "serializer", None)
+    if isinstance(serializer, ListSerializer):
+        serializer = serializer.child
+    if isinstance(serializer, Serializer):
+        return type(serializer)
+    return None
+
+
+def camelize_data(data):
+    """
+    Rename keys of serializer data, or serializer data wrapped in a dict like pages.
+    """
+    serializer_class = get_data_serializer_class(data)
+    if serializer_class:
+        return apply_value_plan(data, get_key_plan(serializer_class))
+    if isinstance(data, dict):
+        return {key: camelize_data(value) for key, value in data.items()}
+    return data
+
+
+class CamelCaseJSONRenderer(JSONRenderer):
+    """
+    JSON renderer with camelCase keys matching generated interfaces.
+
+    Keys are renamed by precomputed plans of the serializers producing the data.
+    Data not produced by serializers is rendered as it is.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return super().render(
+            camelize_data(data), accepted_media_type, renderer_context
+        )
+
+
+class CamelCaseSerializerMixin:
+    """
+    Serializer mixin representing instances with camelCase keys matching generated
+    interfaces.
+    """
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        return apply_value_plan(data, get_key_plan(type(self)))
@@ -6,13 +6,49 @@ $fields
 }"""
 )
 INTERFACE_FIELD_TEMPLATE = Template("  $name: $type;")
+EMPTY_INTERFACE_TEMPLATE = Template("export interface $name {}")
 ENUM_TEMPLATE = Template(
     """export enum $name {
 $members
 }"""
 )
 ENUM_MEMBER_TEMPLATE = Template("  $name = $value")
+CONST_ENUM_TEMPLATE = Template(
+    """export const enum $name {
+$members
+}"""
+)
+ENUM_OBJECT_TEMPLATE = Template(
+    """export const $name = {
+$members
+} as const;
+export type $name = (typeof $name)[keyof typeof $name];"""
+)
+ENUM_OBJECT_MEMBER_TEMPLATE = Template("  $name: $value")
+SHARED_TYPE_TEMPLATE = Template("export type $name = $type;")
+PAGINATED_ALIAS_TEMPLATE = Template("export type $name = $paginated<$type>;")
+REVIVER_TEMPLATE = Template(
+    """export function revive$name(data: any): $name {
+${statements}  return data;
+}"""
+)
+MAPPER_TEMPLATE = Template(
+    """export function map$name(data: any): $name {
+  return {
+$properties
+  };
+}"""
+)
+MAPPER_PROPERTY_TEMPLATE = Template("    $name: $value,")
+VALIDATOR_TEMPLATE = Template(
+    """${constants}export function validate$name(data: any, partial: boolean = false): {[key: string]: string[]} {
+  const errors: {[key: string]: string[]} = {};
+$statements
+  return errors;
+}"""
+)
 IMPORT_TEMPLATE = Template("import { $type } from '$filename';\n")
+IMPORT_TYPE_TEMPLATE = Template("import type { $type } from '$filename';\n")
 HEADER_TEMPLATE = Template(
     """// This file is generated by $generator@$version.
 // You are strongly advised not to manually change this file for backend consistency.
@@ -21,3 +57,133 @@ HEADER_TEMPLATE = Template(
 // Last modified on: $date
 """
 )
+CLIENT_TEMPLATE = Template(
+    """export type QueryParams = Record<string, string | number | boolean | null | undefined>;
+
+export class ApiError extends Error {
+  constructor(readonly response: Response) {
+    super(response.status + ' ' + response.statusText);
+  }
+}
+
+export interface ${name}Options {
+  baseUrl?: string;
+  fetch?: typeof fetch;
+  headers?: Record<string, string>;
+  // maximum count of responses cached by ETag, 0 disables caching
+  cacheSize?: number;
+}
+
+interface CacheEntry {
+  etag: string;
+  data: unknown;
+}
+
+export class $name {
+  private readonly baseUrl: string;
+  private readonly fetchFn: typeof fetch;
+  private readonly headers: Record<string, string>;
+  private readonly cacheSize: number;
+  private readonly inflight = new Map<string, Promise<unknown>>();
+  private readonly cache = new Map<string, CacheEntry>();
+
+  constructor(options: ${name}Options = {}) {
+    const baseUrl = options.baseUrl ?? '/';
+    this.baseUrl = baseUrl.endsWith('/') ? baseUrl : baseUrl + '/';
+    this.fetchFn = options.fetch ?? fetch.bind(globalThis);
+    this.headers = options.headers ?? {};
+    this.cacheSize = options.cacheSize ?? 100;
+  }
+
+  invalidate(path = ''): void {
+    const prefix = this.buildUrl(path);
+    for (const key of Array.from(this.cache.keys())) {
+      if (key.startsWith(prefix)) {
+        this.cache.delete(key);
+      }
+    }
+  }
+
+  protected buildUrl(path: string, params?: QueryParams): string {
+    let url = this.baseUrl + path;
+    if (params) {
+      const search = new URLSearchParams();
+      for (const key of Object.keys(params).sort()) {
+        const value = params[key];
+        if (value !== undefined && value !== null) {
+          search.append(key, String(value));
+        }
+      }
+      const query = search.toString();
+      if (query) {
+        url += '?' + query;
+      }
+    }
+    return url;
+  }
+
+  protected get<T>(path: string, params?: QueryParams): Promise<T> {
+    const url = this.buildUrl(path, params);
+    let request = this.inflight.get(url) as Promise<T> | undefined;
+    if (!request) {
+      request = this.fetchWithCache<T>(url).finally(() => this.inflight.delete(url));
+      this.inflight.set(url, request);
+    }
+    return request;
+  }
+
+  protected async send<T>(method: string, path: string, resource: string, data?: unknown): Promise<T> {
+    const headers: Record<string, string> = {...this.headers};
+    const init: RequestInit = {method, headers};
+    if (data !== undefined) {
+      headers['Content-Type'] = 'application/json';
+      init.body = JSON.stringify(data);
+    }
+    const response = await this.fetchFn(this.buildUrl(path), init);
+    this.invalidate(resource);
+    if (!response.ok) {
+      throw new ApiError(response);
+    }
+    if (response.status === 204) {
+      return undefined as T;
+    }
+    return (await response.json()) as T;
+  }
+
+  private async fetchWithCache<T>(url: string): Promise<T> {
+    const headers: Record<string, string> = {...this.headers};
+    const cached = this.cache.get(url);
+    if (cached) {
+      headers['If-None-Match'] = cached.etag;
+      // least recently used entries are evicted first
+      this.cache.delete(url);
+      this.cache.set(url, cached);
+    }
+    const response = await this.fetchFn(url, {headers});
+    if (response.status === 304 && cached) {
+      return cached.data as T;
+    }
+    if (!response.ok) {
+      throw new ApiError(response);
+    }
+    const data = (await response.json()) as T;
+    const etag = response.headers.get('ETag');
+    this.cache.delete(url);
+    if (etag && this.cacheSize > 0) {
+      this.cache.set(url, {etag, data});
+      if (this.cache.size > this.cacheSize) {
+        this.cache.delete(this.cache.keys().next().value as string);
+      }
+    }
+    return data;
+  }
+$methods
+}"""
+)
+CLIENT_METHOD_TEMPLATE = Template(
+    """
+
+  $name($parameters): Promise<$type> {
+    return $call;
+  }"""
+)
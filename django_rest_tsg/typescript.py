@@ -1,7 +1,14 @@
+import sys
+import threading
+import types
+import warnings
 from collections import ChainMap
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import is_dataclass, fields, dataclass
 from datetime import datetime, date
-from enum import EnumMeta, IntEnum
+from enum import Enum, EnumMeta, IntEnum
 from typing import (
     get_origin,
     get_args,
@@ -14,7 +21,6 @@ from typing import (
     List,
     Tuple,
     Literal,
-    _Final,
 )
 
 import rest_framework
@@ -50,6 +56,7 @@ from rest_framework.serializers import (
     URLField,
     UUIDField,
 )
+from rest_framework.pagination import BasePagination
 from rest_framework_dataclasses.fields import EnumField
 from rest_framework_dataclasses.serializers import DataclassSerializer
 
@@ -61,13 +68,16 @@ else:
 from django_rest_tsg.templates import (
     INTERFACE_TEMPLATE,
     INTERFACE_FIELD_TEMPLATE,
+    EMPTY_INTERFACE_TEMPLATE,
     ENUM_TEMPLATE,
     ENUM_MEMBER_TEMPLATE,
+    CONST_ENUM_TEMPLATE,
+    ENUM_OBJECT_TEMPLATE,
+    ENUM_OBJECT_MEMBER_TEMPLATE,
 )
 
-LEFT_BRACKET = "["
-RIGHT_BRACKET = "]"
 UNION_SEPARATOR = " | "
+LIBRARY_PACKAGES = ("rest_framework", "rest_framework_dataclasses")
 
 TYPESCRIPT_NULLABLE = " | null"
 TYPESCRIPT_ANY = "any"
@@ -76,7 +86,10 @@ TYPESCRIPT_NUMBER = "number"
 TYPESCRIPT_BOOLEAN = "boolean"
 TYPESCRIPT_DATE = "Date"
 
-GENERICS = (tuple, list, dict, Union, Literal)
+if sys.version_info >= (3, 10):
+    UNION_TYPES = (Union, types.UnionType)
+else:
+    UNION_TYPES = (Union,)
 GENERIC_FALLBACK_MAPPING = {
     list: "any[]",
     tuple: "any[]",
@@ -92,6 +105,14 @@ TRIVIAL_TYPE_MAPPING: Dict[Type, str] = {
     type(None): TYPESCRIPT_NULLABLE,
     Any: TYPESCRIPT_ANY,
 }
+SCHEMA_TYPE_MAPPING: Dict[str, str] = {
+    "boolean": TYPESCRIPT_BOOLEAN,
+    "integer": TYPESCRIPT_NUMBER,
+    "number": TYPESCRIPT_NUMBER,
+    "object": "object",
+    "string": TYPESCRIPT_STRING,
+}
+PAGINATED_NAME = "Paginated"
 DRF_FIELD_MAPPING: Dict[Type[Field], str] = {
     BooleanField: TYPESCRIPT_BOOLEAN,
     CharField: TYPESCRIPT_STRING,
@@ -115,16 +136,146 @@ DRF_FIELD_MAPPING: Dict[Type[Field], str] = {
     URLField: TYPESCRIPT_STRING,
     UUIDField: TYPESCRIPT_STRING,
 }
-USER_DEFINED_TYPE_MAPPING: Dict[Type, str] = {}
+
+
+@dataclass
+class TypeTable:
+    """
+    Snapshot of a type registry, with translations cached for this version only.
+    """
+    version: int
+    mapping: Dict[Type, str]
+    translations: Dict[Any, Tuple[str, Tuple[Type, ...]]]
+
+
+class RegisteredTypes(MutableMapping):
+    """
+    Types of a registry, bumping its version on every change.
+    """
+
+    def __init__(self, registry: "TypeRegistry"):
+        self._registry = registry
+        self._types: Dict[Type, str] = {}
+
+    def __getitem__(self, tp: Type) -> str:
+        return self._types[tp]
+
+    def __setitem__(self, tp: Type, name: str):
+        with self._registry._lock:
+            self._types[tp] = name
+            self._registry._version += 1
+
+    def __delitem__(self, tp: Type):
+        with self._registry._lock:
+            del self._types[tp]
+            self._registry._version += 1
+
+    def __iter__(self):
+        return iter(self._types)
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def __repr__(self) -> str:
+        return repr(self._types)
+
+
+class TypeRegistry:
+    """
+    Registry of user-defined types.
+
+    Registration rebuilds a flattened lookup table including trivial types and types
+    of the parent registry, so lookups never walk chained mappings. Tables are
+    replaced as a whole, hence readers in other threads see either version.
+    """
+
+    def __init__(self, parent: Optional["TypeRegistry"] = None):
+        self.parent = parent
+        self._version = 0
+        self._lock = threading.Lock()
+        self.types = RegisteredTypes(self)
+        self._table: Optional[TypeTable] = None
+
+    @property
+    def version(self) -> int:
+        """
+        Version increasing on registration to this registry or its ancestors.
+        """
+        if self.parent is None:
+            return self._version
+        return self._version + self.parent.version
+
+    def register(self, tp: Type, name: Optional[str] = None):
+        self.types[tp] = name or tp.__name__
+        return tp
+
+    def get_table(self) -> TypeTable:
+        table = self._table
+        version = self.version
+        if table is not None and table.version == version:
+            return table
+        with self._lock:
+            mapping = dict(TRIVIAL_TYPE_MAPPING)
+            if self.parent is not None:
+                mapping.update(self.parent.get_table().mapping)
+            mapping.update(self.types)
+            table = TypeTable(version=version, mapping=mapping, translations={})
+            self._table = table
+        return table
+
+    def get(self, tp: Type, default: Optional[str] = None) -> Optional[str]:
+        return self.get_table().mapping.get(tp, default)
+
+
+DEFAULT_TYPE_REGISTRY = TypeRegistry()
+CURRENT_TYPE_REGISTRY: ContextVar[TypeRegistry] = ContextVar(
+    "django_rest_tsg_type_registry", default=DEFAULT_TYPE_REGISTRY
+)
+# kept for compatibility, types should be registered by register()
+USER_DEFINED_TYPE_MAPPING: RegisteredTypes = DEFAULT_TYPE_REGISTRY.types
 TYPE_MAPPING = ChainMap(TRIVIAL_TYPE_MAPPING, USER_DEFINED_TYPE_MAPPING)
+# kept for compatibility, translation does not use it anymore
 TYPE_MAPPING_WITH_GENERIC_FALLBACK = ChainMap(
     TRIVIAL_TYPE_MAPPING, USER_DEFINED_TYPE_MAPPING, GENERIC_FALLBACK_MAPPING
 )
 
 
+def get_registry() -> TypeRegistry:
+    """
+    Get type registry of current context, the default registry if not scoped.
+    """
+    return CURRENT_TYPE_REGISTRY.get()
+
+
+@contextmanager
+def use_registry(registry: TypeRegistry):
+    """
+    Scope type registration and translation of current context to registry.
+    """
+    token = CURRENT_TYPE_REGISTRY.set(registry)
+    try:
+        yield registry
+    finally:
+        CURRENT_TYPE_REGISTRY.reset(token)
+
+
 class TypeScriptCodeType(IntEnum):
     INTERFACE = 0
     ENUM = 1
+    CLIENT = 2
+
+
+class TypeScriptEnumStyle(str, Enum):
+    """
+    Emission style of python enums.
+
+    * enum: ``export enum``, kept as an object at runtime.
+    * const: ``export const enum``, inlined by compilers.
+    * object: ``as const`` object plus a union type, tree-shakable by bundlers.
+    """
+    ENUM = "enum"
+    CONST = "const"
+    OBJECT = "object"
 
 
 @dataclass
@@ -137,33 +288,133 @@ class TypeScriptCode:
     source: Type[Any]
     content: str
     dependencies: List[Type]
+    # dependencies of all fields, including inherited ones, of extending interfaces
+    field_dependencies: Optional[List[Type]] = None
 
 
 def register(tp: Type, name: Optional[str] = None):
     """
-    Register user-defined type.
+    Register user-defined type to registry of current context.
 
     If no name is specified, use type name as default.
     """
-    if name:
-        USER_DEFINED_TYPE_MAPPING[tp] = name
-    else:
-        USER_DEFINED_TYPE_MAPPING[tp] = tp.__name__
-    return tp
+    return get_registry().register(tp, name)
+
 
+def get_property_name(field_name: str) -> str:
+    """foo_bar -> fooBar"""
+    return camelize(field_name, uppercase_first_letter=False)
 
-def tokenize_python_type(tp) -> list[Union[type, str]]:
+
+def _build_literal_type(values) -> str:
     """
-    Flatten a python type to a token list.
+    Build typescript literal type from values of python literal type.
+    """
+    parts = {}
+    for value in values:
+        if isinstance(value, str):
+            part = f"'{value}'"
+        elif isinstance(value, bool):
+            part = str(value).lower()
+        else:
+            part = str(value)
+        parts[part] = None
+    return UNION_SEPARATOR.join(parts)
+
+
+def _translate_type(
+    tp, dependencies: Dict[Type, None], mapping: Dict[Type, str], nested: bool = False
+) -> str:
+    """
+    Translate python type to typescript type in a single pass.
 
-    Tokens can be of the following types:
+    Each annotation node is resolved once, while user-defined types which are not
+    registered are collected into dependencies, an insertion-ordered dict.
+    """
+    origin = get_origin(tp)
+    if origin is Annotated:
+        return _translate_type(get_args(tp)[0], dependencies, mapping, nested)
+    if origin is None:
+        if tp in mapping:
+            return mapping[tp]
+        if tp in (list, tuple):
+            return "Array<any>" if nested else GENERIC_FALLBACK_MAPPING[tp]
+        if tp is dict:
+            return GENERIC_FALLBACK_MAPPING[tp]
+        if not isclass(tp):
+            return TYPESCRIPT_ANY
+        dependencies[tp] = None
+        return tp.__name__
+    args = get_args(tp)
+    if origin is Literal:
+        return _build_literal_type(args)
+    if origin in UNION_TYPES:
+        # dict keeps the order of children while deduplicating them in linear time
+        children = {}
+        nullable = False
+        for arg in args:
+            if arg is type(None):
+                nullable = True
+                continue
+            children[_translate_type(arg, dependencies, mapping, nested=True)] = None
+        result = UNION_SEPARATOR.join(children)
+        if nullable:
+            result += TYPESCRIPT_NULLABLE
+        return result
+    if origin in (list, tuple):
+        if not args:
+            return "Array<any>"
+        item = _translate_type(args[0], dependencies, mapping, nested=True)
+        return f"Array<{item}>"
+    if origin is dict:
+        if not args:
+            return GENERIC_FALLBACK_MAPPING[dict]
+        key = _translate_type(args[0], dependencies, mapping, nested=True)
+        value = _translate_type(args[1], dependencies, mapping, nested=True)
+        return f"{{[key: {key}]: {value}}}"
+    if origin in mapping:
+        return mapping[origin]
+    return TYPESCRIPT_ANY
+
+
+def build_type(tp) -> Tuple[str, List[Type]]:
+    """
+    Build typescript type from python type.
 
-    * Literals: 'foo', 42
-    * Built-in types: list, dict
-    * Types in typing module: Union, Literal
-    * Brackets: '[' or ']'
-    * User defined types
+    Translations are cached per version of the type registry of current context.
     """
+    table = get_registry().get_table()
+    try:
+        translation = table.translations.get(tp)
+        hashable = True
+    except TypeError:
+        # unhashable metadata of Annotated
+        translation, hashable = None, False
+    if translation is None:
+        dependencies: Dict[Type, None] = {}
+        representation = _translate_type(tp, dependencies, table.mapping)
+        translation = (representation, tuple(dependencies))
+        if hashable:
+            table.translations[tp] = translation
+    return translation[0], list(translation[1])
+
+
+LEFT_BRACKET = "["
+RIGHT_BRACKET = "]"
+GENERICS = (tuple, list, dict, Union, Literal)
+
+
+def tokenize_python_type(tp) -> List[Union[type, str]]:
+    """
+    Flatten a python type to a token list.
+
+    Deprecated, since build_type translates annotations in a single pass.
+    """
+    warnings.warn(
+        "tokenize_python_type() is deprecated, use build_type() instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
     if get_origin(tp) is Annotated:
         tp = get_args(tp)[0]
 
@@ -215,88 +466,22 @@ def tokenize_python_type(tp) -> list[Union[type, str]]:
     return result
 
 
-def _build_type(tokens) -> str:
-    """
-    Build typescript type from tokens.
-    """
-    generic_stack: List = []
-    children_stack: List[List] = []
-
-    # fallback
-    if len(tokens) == 1:
-        tp = tokens[0]
-        return TYPE_MAPPING_WITH_GENERIC_FALLBACK.get(tp, tp.__name__)
-
-    for token in tokens:
-        if token in GENERICS:
-            generic_stack.append(token)
-        elif token is LEFT_BRACKET:
-            children_stack.append([])
-        elif token is RIGHT_BRACKET:
-            generic = generic_stack.pop()
-            children = children_stack.pop()
-            generic_children = []
-            for child in children:
-                if child not in generic_children:
-                    generic_children.append(child)
-            generic_type = _build_generic_type(generic, generic_children)
-            if len(children_stack) > 0:
-                children_stack[-1].append(generic_type)
-            else:
-                return generic_type
-        else:
-            children_stack[-1].append(TYPE_MAPPING.get(token, token))
-
-
-def _build_generic_type(tp, children=None) -> str:
-    """
-    Build typescript type from python generic type with children.
-    """
-    if not children:
-        children = []
-    if tp is Union:
-        if len(children) == 2 and TYPESCRIPT_NULLABLE in children:
-            for child in children:
-                if child == TYPESCRIPT_NULLABLE:
-                    continue
-                return "".join((child, TYPESCRIPT_NULLABLE))
-        return " | ".join(children)
-    elif tp in (list, tuple) and children:
-        return f"Array<{children[0]}>"
-    elif tp is dict and children:
-        return f"{{[key: {children[0]}]: {children[1]}}}"
-    elif tp is Literal:
-        parts = []
-        for child in children:
-            if isinstance(child, str):
-                part = f"'{child}'"
-            else:
-                part = str(child)
-            parts.append(part)
-        return " | ".join(parts)
-
-
-def build_type(tp) -> Tuple[str, List[Type]]:
-    """
-    Build typescript type from python type.
-    """
-    tokens = tokenize_python_type(tp)
-    dependencies = [
-        token
-        for token in tokens
-        if token not in TYPE_MAPPING_WITH_GENERIC_FALLBACK
-        and not type(token) in TRIVIAL_TYPE_MAPPING
-        and not isinstance(token, _Final)
-    ]
-    return _build_type(tokens), dependencies
-
-
 def build_enum(
-    enum_tp: EnumMeta, enum_name: str = None, enforce_uppercase: bool = False
+    enum_tp: EnumMeta,
+    enum_name: str = None,
+    enforce_uppercase: bool = False,
+    enum_style: Union[TypeScriptEnumStyle, str] = TypeScriptEnumStyle.ENUM,
 ) -> TypeScriptCode:
     """
     Build typescript enum from python enum.
     """
+    enum_style = TypeScriptEnumStyle(enum_style)
+    if enum_style is TypeScriptEnumStyle.OBJECT:
+        template, member_template = ENUM_OBJECT_TEMPLATE, ENUM_OBJECT_MEMBER_TEMPLATE
+    elif enum_style is TypeScriptEnumStyle.CONST:
+        template, member_template = CONST_ENUM_TEMPLATE, ENUM_MEMBER_TEMPLATE
+    else:
+        template, member_template = ENUM_TEMPLATE, ENUM_MEMBER_TEMPLATE
     enum_members = []
     for name, member in enum_tp.__members__.items():
         member_type = type(member.value)
@@ -309,7 +494,7 @@ def build_enum(
             member_name = camelize(name.lower(), uppercase_first_letter=False)
             member_name = member_name[0].upper() + member_name[1:]
         enum_members.append(
-            ENUM_MEMBER_TEMPLATE.substitute(name=member_name, value=member_value)
+            member_template.substitute(name=member_name, value=member_value)
         )
     if not enum_name:
         enum_name = enum_tp.__name__
@@ -318,39 +503,180 @@ def build_enum(
         source=enum_tp,
         name=enum_name,
         dependencies=[],
-        content=ENUM_TEMPLATE.substitute(
+        content=template.substitute(
             members=",\n".join(enum_members), name=enum_tp.__name__
         ),
     )
 
 
+def get_interface_base(tp: Type) -> Optional[Type]:
+    """
+    Get nearest base class of serializer or dataclass, which has its own interface.
+
+    Serializer classes of django rest framework and its extensions are skipped, so are
+    abstract model or dataclass serializers without Meta.
+    """
+    for base in tp.__mro__[1:]:
+        if is_dataclass(tp):
+            if is_dataclass(base):
+                return base
+            continue
+        if (
+            not issubclass(base, Serializer)
+            or base.__module__.partition(".")[0] in LIBRARY_PACKAGES
+        ):
+            continue
+        if issubclass(base, (ModelSerializer, DataclassSerializer)) and not hasattr(
+            base, "Meta"
+        ):
+            continue
+        return base
+    return None
+
+
+def get_interface_name(tp: Type) -> str:
+    """
+    Get name of interface referenced by other interfaces.
+    """
+    if issubclass(tp, Serializer):
+        default = get_serializer_prefix(tp)
+    else:
+        default = tp.__name__
+    return get_registry().get(tp, default)
+
+
+def _get_dataclass_fields(data_cls) -> Tuple[Dict[str, str], Dict[str, List[Type]]]:
+    """
+    Get typescript types and dependencies of dataclass fields by property names.
+    """
+    interface_fields = {}
+    field_dependencies = {}
+    for field in fields(data_cls):
+        name = get_property_name(field.name)
+        interface_fields[name], field_dependencies[name] = build_type(field.type)
+    return interface_fields, field_dependencies
+
+
+def _build_interface(
+    interface_name: str,
+    interface_fields: Dict[str, str],
+    base: Optional[Type] = None,
+    base_fields: Optional[Dict[str, str]] = None,
+) -> Tuple[str, List[str]]:
+    """
+    Build interface content and names of emitted fields.
+
+    With a base, only added or overridden fields are emitted, while fields removed
+    or overridden by different types are omitted from the base.
+    """
+    if base is None:
+        names = list(interface_fields)
+        heading = interface_name
+    else:
+        names = [
+            name
+            for name, field_type in interface_fields.items()
+            if base_fields.get(name) != field_type
+        ]
+        omitted = [
+            name
+            for name in base_fields
+            if name not in interface_fields or name in names
+        ]
+        base_name = get_interface_name(base)
+        if omitted:
+            keys = UNION_SEPARATOR.join(f"'{name}'" for name in omitted)
+            base_name = f"Omit<{base_name}, {keys}>"
+        heading = f"{interface_name} extends {base_name}"
+    lines = [
+        INTERFACE_FIELD_TEMPLATE.substitute(name=name, type=interface_fields[name])
+        for name in names
+    ]
+    if lines:
+        content = INTERFACE_TEMPLATE.substitute(fields="\n".join(lines), name=heading)
+    else:
+        content = EMPTY_INTERFACE_TEMPLATE.substitute(name=heading)
+    return content, names
+
+
 def build_interface_from_dataclass(
-    data_cls, interface_name: str = None
+    data_cls, interface_name: str = None, base: Optional[Type] = None
 ) -> TypeScriptCode:
     """
     Build typescript interface from python dataclass.
+
+    With a base dataclass, the interface extends the one of base.
     """
     assert is_dataclass(data_cls)
     if not interface_name:
         interface_name = data_cls.__name__
-    interface_fields = []
+    interface_fields, field_dependencies = _get_dataclass_fields(data_cls)
+    base_fields = _get_dataclass_fields(base)[0] if base else None
+    content, names = _build_interface(
+        interface_name, interface_fields, base, base_fields
+    )
     interface_dependencies = set()
-    for field in fields(data_cls):
-        field_type_representation, field_dependencies = build_type(field.type)
-        interface_dependencies |= set(field_dependencies)
-        interface_fields.append(
-            INTERFACE_FIELD_TEMPLATE.substitute(
-                name=camelize(field.name, uppercase_first_letter=False),
-                type=field_type_representation,
-            )
+    for name in names:
+        interface_dependencies |= set(field_dependencies[name])
+    all_dependencies = None
+    if base:
+        interface_dependencies.add(base)
+        all_dependencies = sorted(
+            set().union(*field_dependencies.values()), key=lambda tp: tp.__name__
         )
     return TypeScriptCode(
         type=TypeScriptCodeType.INTERFACE,
         source=data_cls,
         name=interface_name,
         dependencies=list(interface_dependencies),
+        content=content,
+        field_dependencies=all_dependencies,
+    )
+
+
+def _get_schema_type(schema: dict) -> str:
+    """
+    Get typescript type from OpenAPI schema of pagination.
+    """
+    schema_type = schema.get("type")
+    if schema_type == "array":
+        result = _get_schema_type(schema.get("items", {})) + "[]"
+    else:
+        result = SCHEMA_TYPE_MAPPING.get(schema_type, TYPESCRIPT_ANY)
+    if schema.get("nullable") and result != TYPESCRIPT_ANY:
+        result += TYPESCRIPT_NULLABLE
+    return result
+
+
+def build_paginated_interface(
+    pagination_class: Type[BasePagination], interface_name: str = PAGINATED_NAME
+) -> TypeScriptCode:
+    """
+    Build generic typescript interface of pages from django rest framework pagination.
+
+    Pages are derived from the response schema of pagination, whose results are T[].
+    Properties are always present, since paginated responses include null links.
+    Pagination classes without a response schema are assumed to page results only.
+    """
+    results_schema = {"type": "array", "items": {}}
+    schema = pagination_class().get_paginated_response_schema(results_schema)
+    properties = schema.get("properties") or {"results": results_schema}
+    interface_fields = []
+    for name, property_schema in properties.items():
+        if property_schema is results_schema:
+            field_type = "T[]"
+        else:
+            field_type = _get_schema_type(property_schema)
+        interface_fields.append(
+            INTERFACE_FIELD_TEMPLATE.substitute(name=name, type=field_type)
+        )
+    return TypeScriptCode(
+        type=TypeScriptCodeType.INTERFACE,
+        source=pagination_class,
+        name=interface_name,
+        dependencies=[],
         content=INTERFACE_TEMPLATE.substitute(
-            fields="\n".join(interface_fields), name=interface_name
+            fields="\n".join(interface_fields), name=f"{interface_name}<T>"
         ),
     )
 
@@ -381,14 +707,14 @@ def _get_serializer_field_type(field: Field) -> Tuple[str, Optional[Type]]:
         field_type = field.enum_class.__name__
         dependency = field.enum_class
     elif isinstance(field, ChoiceField):
-        parts = []
+        parts = {}
         for value in field.choices.values():
             if isinstance(value, str):
                 part = f"'{value}'"
             else:
                 part = str(value)
-            parts.append(part)
-        field_type = " | ".join(parts)
+            parts[part] = None
+        field_type = UNION_SEPARATOR.join(parts)
     elif isinstance(field, ManyRelatedField):
         raise Exception("No explicit type hinting.")
     elif isinstance(field, ListSerializer):
@@ -434,41 +760,64 @@ def get_serializer_field_type(field: Field) -> Tuple[str, list]:
     return result, sorted(list(dependencies), key=lambda tp: tp.__name__)
 
 
-def build_interface_from_serializer(
-    serializer_class: Type[Serializer], interface_name: Optional[str] = None
-) -> TypeScriptCode:
+def _get_serializer_fields(
+    serializer_class: Type[Serializer],
+) -> Tuple[Dict[str, str], Dict[str, List[Type]]]:
     """
-    Build typescript interface from django rest framework serializer.
+    Get typescript types and dependencies of serializer fields by property names.
     """
-    assert issubclass(serializer_class, Serializer)
     serializer: Serializer = serializer_class()
-    interface_fields = []
-    interface_dependencies = set()
+    interface_fields = {}
+    field_dependencies = {}
     for field_name, field_instance in serializer.get_fields().items():
         field_instance: Field
+        name = get_property_name(field_name)
         field_type = type(field_instance)
         if field_type in DRF_FIELD_MAPPING:
             field_type = DRF_FIELD_MAPPING[field_type]
             if field_instance.allow_null:
                 field_type += TYPESCRIPT_NULLABLE
+            field_dependencies[name] = []
         else:
-            field_type, field_dependencies = get_serializer_field_type(field_instance)
-            for dependency in field_dependencies:
-                interface_dependencies.add(dependency)
-        interface_fields.append(
-            INTERFACE_FIELD_TEMPLATE.substitute(
-                name=camelize(field_name, uppercase_first_letter=False), type=field_type
+            field_type, field_dependencies[name] = get_serializer_field_type(
+                field_instance
             )
-        )
+        interface_fields[name] = field_type
+    return interface_fields, field_dependencies
+
 
+def build_interface_from_serializer(
+    serializer_class: Type[Serializer],
+    interface_name: Optional[str] = None,
+    base: Optional[Type[Serializer]] = None,
+) -> TypeScriptCode:
+    """
+    Build typescript interface from django rest framework serializer.
+
+    With a base serializer, the interface extends the one of base.
+    """
+    assert issubclass(serializer_class, Serializer)
+    interface_fields, field_dependencies = _get_serializer_fields(serializer_class)
     if not interface_name:
         interface_name = get_serializer_prefix(serializer_class)
+    base_fields = _get_serializer_fields(base)[0] if base else None
+    content, names = _build_interface(
+        interface_name, interface_fields, base, base_fields
+    )
+    interface_dependencies = set()
+    for name in names:
+        interface_dependencies |= set(field_dependencies[name])
+    all_dependencies = None
+    if base:
+        interface_dependencies.add(base)
+        all_dependencies = sorted(
+            set().union(*field_dependencies.values()), key=lambda tp: tp.__name__
+        )
     return TypeScriptCode(
         type=TypeScriptCodeType.INTERFACE,
         source=serializer_class,
         name=interface_name,
         dependencies=sorted(list(interface_dependencies), key=lambda tp: tp.__name__),
-        content=INTERFACE_TEMPLATE.substitute(
-            fields="\n".join(interface_fields), name=interface_name
-        ),
+        content=content,
+        field_dependencies=all_dependencies,
     )
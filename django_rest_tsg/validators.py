@@ -0,0 +1,316 @@
+import re
+from decimal import Decimal
+from inspect import isclass
+from typing import Collection, Callable, Dict, List, Optional, Tuple, Type
+
+from django.core.validators import (
+    BaseValidator,
+    MaxLengthValidator,
+    MaxValueValidator,
+    MinLengthValidator,
+    MinValueValidator,
+    RegexValidator,
+)
+from rest_framework.serializers import (
+    CharField,
+    ChoiceField,
+    DecimalField,
+    Field,
+    FloatField,
+    IntegerField,
+    MultipleChoiceField,
+    Serializer,
+)
+
+from django_rest_tsg.templates import VALIDATOR_TEMPLATE
+from django_rest_tsg.typescript import get_property_name
+
+INDENT = "  "
+# stands for a value only known at runtime in error messages
+PLACEHOLDER = "\x00"
+RUNTIME_PARAMETERS = re.compile(r"%\((?:show_value|value)\)[sd]")
+PYTHON_ANCHORS = re.compile(r"(?<!\\)((?:\\\\)*)\\([AZ])")
+JAVASCRIPT_FLAGS = {re.IGNORECASE: "i", re.MULTILINE: "m", re.DOTALL: "s"}
+# comments, inline flags, atomic groups, conditionals and possessive quantifiers
+UNSUPPORTED_PATTERNS = re.compile(
+    r"\(\?(?:#|>|\(|[aiLmsux-]+[:)])|(?<!\\)(?:\\\\)*[*+?}]\+"
+)
+# classes matching unicode in python, but only ascii in javascript
+UNICODE_CLASSES = re.compile(r"(?<!\\)(?:\\\\)*\\[wWdDbB]")
+LENGTH_CHECKS = {MaxLengthValidator: ">", MinLengthValidator: "<"}
+VALUE_CHECKS = {MaxValueValidator: ">", MinValueValidator: "<"}
+# constants of default messages shared by fields
+MESSAGE_CONSTANTS = {"required": "requiredMessage", "null": "nullMessage"}
+
+# A check is (condition, negated condition, statements run when condition holds).
+# Statements of None accept the value, skipping the following checks.
+Check = Tuple[str, str, Optional[List[str]]]
+
+
+def _quote(text: str) -> str:
+    escaped = text.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
+    return f"'{escaped}'"
+
+
+def build_message(message, expression: Optional[str] = None) -> str:
+    """
+    Build typescript expression of error message.
+
+    Placeholders of message are replaced by the runtime expression.
+    """
+    message = str(message)
+    if expression is None or PLACEHOLDER not in message:
+        return _quote(message.replace(PLACEHOLDER, ""))
+    escaped = message.replace("\\", "\\\\").replace("`", "\\`").replace("${", "\\${")
+    return "`" + escaped.replace(PLACEHOLDER, "${" + expression + "}") + "`"
+
+
+def get_validator_message(validator) -> str:
+    """
+    Format message of django validator like ValidationError does, except for runtime
+    parameters.
+    """
+    message = RUNTIME_PARAMETERS.sub(PLACEHOLDER, str(validator.message))
+    params = {}
+    if isinstance(validator, BaseValidator):
+        params["limit_value"] = validator.limit_value
+    try:
+        return message % params
+    except (KeyError, TypeError, ValueError):
+        return message
+
+
+def get_javascript_pattern(validator: RegexValidator) -> Optional[str]:
+    """
+    Build typescript RegExp of regex validator.
+
+    Python only syntax and flags are not translated, returning None, as well as
+    unicode word, digit and boundary classes, unless the pattern is ascii only.
+    """
+    regex = validator.regex
+    pattern = regex.pattern
+    if not isinstance(pattern, str) or UNSUPPORTED_PATTERNS.search(pattern):
+        return None
+    if not regex.flags & re.ASCII and UNICODE_CLASSES.search(pattern):
+        return None
+    flags = ""
+    remaining_flags = regex.flags & ~(re.UNICODE | re.ASCII)
+    for flag, javascript_flag in JAVASCRIPT_FLAGS.items():
+        if remaining_flags & flag:
+            flags += javascript_flag
+            remaining_flags &= ~flag
+    if remaining_flags:
+        return None
+    pattern = PYTHON_ANCHORS.sub(
+        lambda match: match.group(1) + ("^" if match.group(2) == "A" else "$"),
+        pattern,
+    )
+    pattern = re.sub(r"\(\?P=(\w+)\)", r"\\k<\1>", pattern.replace("(?P<", "(?<"))
+    if flags:
+        return f"new RegExp({_quote(pattern)}, {_quote(flags)})"
+    return f"new RegExp({_quote(pattern)})"
+
+
+def _build_chain(checks: List[Check], final: List[str]) -> List[str]:
+    """
+    Build if-else chain running the first matched check, or final statements.
+    """
+    lines = []
+    guards = []
+    keyword = "if"
+    for condition, negation, statements in checks:
+        if statements is None:
+            guards.append(negation)
+            continue
+        lines.append(f"{keyword} ({' && '.join(guards + [condition])}) {{")
+        lines += [INDENT + line for line in statements]
+        keyword = "} else if"
+    if final:
+        if guards:
+            lines.append(f"{keyword} ({' && '.join(guards)}) {{")
+        elif lines:
+            lines.append("} else {")
+        else:
+            return final
+        lines += [INDENT + line for line in final]
+    if lines:
+        lines.append("}")
+    return lines
+
+
+def _build_report(name: str, failures: List[Tuple[str, str]]) -> List[str]:
+    if not failures:
+        return []
+    if len(failures) == 1:
+        condition, message = failures[0]
+        return [f"if ({condition}) errors.{name} = [{message}];"]
+    lines = ["const messages: string[] = [];"]
+    for condition, message in failures:
+        lines.append(f"if ({condition}) messages.push({message});")
+    lines.append(f"if (messages.length) errors.{name} = messages;")
+    return lines
+
+
+def _build_value_validation(field: Field, name: str, constants: List[str]) -> List[str]:
+    """
+    Build statements validating a non-null value by constraints of field.
+    """
+    failures = []
+    if isinstance(field, MultipleChoiceField):
+        return []
+    if isinstance(field, ChoiceField):
+        if not all(isinstance(key, (str, int)) for key in field.choices):
+            return []
+        choices = f"{name}Choices"
+        # String() of javascript booleans is lowercase
+        values = ", ".join(
+            _quote(str(key).lower() if isinstance(key, bool) else str(key))
+            for key in field.choices
+        )
+        constants.append(f"const {choices} = new Set([{values}]);")
+        message = build_message(
+            field.error_messages["invalid_choice"].format(input=PLACEHOLDER), "value"
+        )
+        failures.append((f"!{choices}.has(String(value))", message))
+        checks = [("value === ''", "value !== ''", None)] if field.allow_blank else []
+        return _build_chain(checks, _build_report(name, failures))
+    if isinstance(field, CharField):
+        patterns = []
+        for validator in field.validators:
+            message = get_validator_message(validator)
+            operator = LENGTH_CHECKS.get(type(validator))
+            if operator and isinstance(validator.limit_value, int):
+                condition = f"text.length {operator} {validator.limit_value}"
+                failures.append((condition, build_message(message, "text.length")))
+            elif type(validator) is RegexValidator:
+                pattern = get_javascript_pattern(validator)
+                if pattern is None:
+                    continue
+                patterns.append(pattern)
+                constant = f"{name}Pattern{len(patterns) if len(patterns) > 1 else ''}"
+                constants.append(f"const {constant} = {pattern};")
+                negation = "" if validator.inverse_match else "!"
+                condition = f"{negation}{constant}.test(text)"
+                failures.append((condition, build_message(message, "text")))
+        text = "String(value).trim()" if field.trim_whitespace else "String(value)"
+        blank = None
+        if not field.allow_blank:
+            message = build_message(field.error_messages["blank"])
+            blank = [f"errors.{name} = [{message}];"]
+        final = _build_report(name, failures)
+        if blank is None and not final:
+            return []
+        checks = [("text === ''", "text !== ''", blank)]
+        return [f"const text = {text};", *_build_chain(checks, final)]
+    if isinstance(field, (IntegerField, FloatField, DecimalField)):
+        for validator in field.validators:
+            operator = VALUE_CHECKS.get(type(validator))
+            limit = getattr(validator, "limit_value", None)
+            if not operator or not isinstance(limit, (int, float, Decimal)):
+                continue
+            message = get_validator_message(validator)
+            failures.append(
+                (f"Number(value) {operator} {limit}", build_message(message, "value"))
+            )
+        return _build_report(name, failures)
+    return []
+
+
+def get_field_message(field: Field, key: str, constants: List[str]) -> str:
+    """
+    Build typescript expression of error message of field.
+
+    Default messages shared by fields are hoisted into module constants.
+    """
+    message = build_message(field.error_messages[key])
+    if message != build_message(Field.default_error_messages[key]):
+        return message
+    constant = MESSAGE_CONSTANTS[key]
+    declaration = f"const {constant} = {message};"
+    if declaration not in constants:
+        constants.append(declaration)
+    return constant
+
+
+def _build_presence_check(condition: str, names: List[str], message: str) -> List[str]:
+    """
+    Build statements reporting properties whose value matches condition.
+    """
+    if len(names) == 1:
+        value = f"data.{names[0]}"
+        return [f"if ({condition.format(value)}) errors.{names[0]} = [{message}];"]
+    keys = ", ".join(_quote(name) for name in names)
+    return [
+        f"for (const name of [{keys}]) {{",
+        INDENT + f"if ({condition.format('data[name]')}) errors[name] = [{message}];",
+        "}",
+    ]
+
+
+def build_field_validation(field: Field, name: str, constants: List[str]) -> List[str]:
+    """
+    Build statements validating a present, non-null property like django rest
+    framework does.
+    """
+    final = _build_value_validation(field, name, constants)
+    if not final:
+        return []
+    checks: List[Check] = [("value == null", "value != null", None)]
+    return [
+        "{",
+        INDENT + f"const value = data.{name};",
+        *(INDENT + line for line in _build_chain(checks, final)),
+        "}",
+    ]
+
+
+def build_validator(
+    tp: Type,
+    interface_name: str,
+    dependencies: Collection[Type],
+    get_name: Callable[[Type], str],
+) -> Tuple[str, List[Type]]:
+    """
+    Build typescript function validating data of serializer interface.
+
+    Required, null, blank, length, value, pattern and choice constraints of writable
+    fields are checked with error messages of django rest framework, returning errors
+    by property name. Nested serializers are left to the server.
+    Empty content is returned if there is nothing to validate.
+    """
+    if not (isclass(tp) and issubclass(tp, Serializer)):
+        return "", []
+    constants = []
+    statements = []
+    # properties by message, checked in a loop per message
+    required: Dict[str, List[str]] = {}
+    null: Dict[str, List[str]] = {}
+    writable_fields = [
+        (get_property_name(field_name), field)
+        for field_name, field in tp().get_fields().items()
+        if not field.read_only
+    ]
+    for name, field in writable_fields:
+        if field.required:
+            message = get_field_message(field, "required", constants)
+            required.setdefault(message, []).append(name)
+        if not field.allow_null:
+            message = get_field_message(field, "null", constants)
+            null.setdefault(message, []).append(name)
+    for message, names in required.items():
+        statements += _build_presence_check(
+            "!partial && {} === undefined", names, message
+        )
+    for message, names in null.items():
+        statements += _build_presence_check("{} === null", names, message)
+    for name, field in writable_fields:
+        statements += build_field_validation(field, name, constants)
+    if not statements:
+        return "", []
+    content = VALIDATOR_TEMPLATE.substitute(
+        name=interface_name,
+        constants="".join(constant + "\n" for constant in constants)
+        + ("\n" if constants else ""),
+        statements="\n".join(INDENT + line for line in statements),
+    )
+    return content, []
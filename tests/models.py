@@ -81,3 +81,12 @@ class Department:
 class UserList:
     id: int
     users: List[Union[User, int, str]]
+
+
+@dataclass
+class Coordinate:
+    x: float
+    y: float
+
+
+typescript.register(Coordinate, "Point")
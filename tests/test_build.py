@@ -1,22 +1,59 @@
+import io
+import json
+import os
 import shutil
+import subprocess
+import sys
 import tempfile
+import threading
 import time
 
 import pytest
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
 from itertools import chain
 
 from django.core.management import call_command
+from django.test import override_settings
 from rest_framework import serializers
+from rest_framework.pagination import (
+    BasePagination,
+    LimitOffsetPagination,
+    PageNumberPagination,
+)
 
 from django_rest_tsg.build import (
+    BuildException,
+    TypeScriptBuildGraph,
     TypeScriptBuilder,
     TypeScriptBuilderConfig,
     build,
+    get_content_digest,
     get_relative_path,
     get_digest,
+    get_shared_type_name,
+    get_type_name,
+    lazy_tasks,
+    partition_tasks,
+)
+from django_rest_tsg.lock import BuildLock
+from django_rest_tsg.management.commands.buildtypescript import Command
+from django_rest_tsg.typescript import (
+    DEFAULT_TYPE_REGISTRY,
+    TypeRegistry,
+    build_paginated_interface,
+    use_registry,
+)
+from tests.models import ButtonType, Department, PermissionFlag, User
+from tests.serializers import (
+    ChildSerializer,
+    DepartmentSerializer,
+    ParentSerializer,
+    PathSerializer,
+    PathWrapperSerializer,
+    UserSerializer,
 )
-from tests.serializers import PathSerializer, PathWrapperSerializer
 from tests.test_dataclass import USER_INTERFACE
 from tests.tsgconfig import BUILD_TASKS
 from tests.test_serializer import PATH_INTERFACE, DEPARTMENT_INTERFACE
@@ -140,6 +177,28 @@ def test_command(tmp_path: Path):
     assert "permission-flag.enum.ts" in tmp_files
 
 
+def test_command_ndjson(tmp_path: Path):
+    stdout = io.StringIO()
+    call_command(
+        "buildtypescript",
+        "tests",
+        "--build-dir",
+        str(tmp_path),
+        "--format",
+        "ndjson",
+        stdout=stdout,
+    )
+    assert not any(tmp_path.iterdir())
+    records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert len(records) == len(BUILD_TASKS)
+    records = {record["path"]: record for record in records}
+    child = records["foobar-child.ts"]
+    assert child["source"] == "tests.serializers.ChildSerializer"
+    assert child["content"] == FOOBAR_CHILD_INTERFACE
+    assert child["digest"] == get_content_digest(FOOBAR_CHILD_INTERFACE)
+    assert child["dependencies"] == ["foobar-parent"]
+
+
 def test_content_change(tmp_path: Path):
     tasks = [build(PathSerializer)]
     config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=tasks)
@@ -172,3 +231,560 @@ def test_content_change(tmp_path: Path):
     assert skip_lines(build_file.read_text()) == PATH_V2_INTERFACE
     assert digest != digest_v2
     assert last_modified_on_v2 > last_modified_on
+
+
+def test_shared_types(tmp_path: Path):
+    class TagSerializer(serializers.Serializer):
+        name = serializers.CharField()
+        labels = serializers.HStoreField()
+
+    class ArticleSerializer(serializers.Serializer):
+        labels = serializers.HStoreField()
+        suffixes = serializers.ListField(child=serializers.CharField())
+
+    tasks = [build(TagSerializer), build(ArticleSerializer), build(PathSerializer)]
+    config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=tasks, shared_types=True)
+    builder = TypeScriptBuilder(config)
+    builder.build_all()
+    shared_type_name = get_shared_type_name("{[index: string]: string | null}")
+    assert skip_lines((tmp_path / "shared-types.ts").read_text()) == (
+        f"export type {shared_type_name} = {{[index: string]: string | null}};"
+    )
+    assert skip_lines((tmp_path / "tag.ts").read_text()) == (
+        f"import {{ {shared_type_name} }} from './shared-types';\n"
+        "\n"
+        "export interface Tag {\n"
+        "  name: string;\n"
+        f"  labels: {shared_type_name};\n"
+        "}"
+    )
+    # short types are kept inline
+    assert skip_lines((tmp_path / "path.ts").read_text()) == PATH_INTERFACE
+
+
+@pytest.mark.parametrize(
+    "enum_style,enum_import",
+    [
+        ("enum", "import type { ButtonType } from './button-type.enum';"),
+        ("object", "import type { ButtonType } from './button-type.enum';"),
+        ("const", "import type { ButtonType } from './button-type.enum';"),
+    ],
+)
+def test_type_only_imports(tmp_path: Path, enum_style: str, enum_import: str):
+    tasks = [
+        build(ButtonType, {"enum_style": enum_style}),
+        build(User),
+        build(DepartmentSerializer),
+    ]
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path, tasks=tasks, type_only_imports=True
+    )
+    builder = TypeScriptBuilder(config)
+    builder.build_all()
+    assert (tmp_path / "user.ts").read_text().splitlines()[6] == enum_import
+    assert (tmp_path / "department.ts").read_text().splitlines()[6] == (
+        "import type { User } from './user';"
+    )
+
+
+def test_declaration(tmp_path: Path):
+    tasks = [
+        build(ButtonType, {"enum_style": "const"}),
+        build(PermissionFlag),
+        build(User),
+    ]
+    builder = TypeScriptBuilder(
+        TypeScriptBuilderConfig(build_dir=tmp_path, tasks=tasks)
+    )
+    builder.build_all()
+    assert (tmp_path / "user.ts").exists()
+    config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=tasks, declaration=True)
+    builder = TypeScriptBuilder(config)
+    builder.build_all()
+    assert sorted(file.name for file in tmp_path.iterdir()) == [
+        "button-type.enum.d.ts",
+        "permission-flag.enum.ts",
+        "user.d.ts",
+    ]
+    assert skip_lines((tmp_path / "user.d.ts").read_text(), 8) == USER_INTERFACE
+    assert (tmp_path / "button-type.enum.d.ts").read_text().splitlines()[6] == (
+        "export declare const enum ButtonType {"
+    )
+
+
+DEPARTMENT_REVIVER = """export function reviveDepartment(data: any): Department {
+  if (data.principals != null) {
+    for (let i0 = 0; i0 < data.principals.length; i0++) {
+      if (data.principals[i0] != null) reviveUser(data.principals[i0]);
+    }
+  }
+  return data;
+}"""
+
+
+def test_revivers(tmp_path: Path):
+    class EventSerializer(serializers.Serializer):
+        at = serializers.DateTimeField(allow_null=True)
+        tags = serializers.DictField(child=serializers.DateField())
+        path = PathSerializer()
+
+    tasks = [
+        build(User),
+        build(DepartmentSerializer),
+        build(EventSerializer),
+        build(PathSerializer),
+    ]
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path,
+        tasks=tasks,
+        revivers=True,
+        type_only_imports=True,
+        declaration=True,
+    )
+    TypeScriptBuilder(config).build_all()
+    department = (tmp_path / "department.ts").read_text()
+    assert department.splitlines()[6:8] == [
+        "import type { User } from './user';",
+        "import { reviveUser } from './user';",
+    ]
+    assert department.endswith(DEPARTMENT_REVIVER)
+    assert (tmp_path / "event.ts").read_text().endswith(
+        "export function reviveEvent(data: any): Event {\n"
+        "  if (data.at != null) data.at = new Date(data.at);\n"
+        "  if (data.tags != null) {\n"
+        "    for (const k0 in data.tags) {\n"
+        "      if (data.tags[k0] != null) data.tags[k0] = new Date(data.tags[k0]);\n"
+        "    }\n"
+        "  }\n"
+        "  return data;\n"
+        "}"
+    )
+    # nothing to revive
+    assert skip_lines((tmp_path / "path.d.ts").read_text()) == PATH_INTERFACE
+
+
+def test_mappers(tmp_path: Path):
+    class CatalogSerializer(serializers.Serializer):
+        created_at = serializers.DateTimeField()
+        department_map = serializers.DictField(child=DepartmentSerializer())
+
+    tasks = [build(User), build(DepartmentSerializer), build(CatalogSerializer)]
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path, tasks=tasks, revivers=True, mappers=True
+    )
+    TypeScriptBuilder(config).build_all()
+    assert (tmp_path / "department.ts").read_text().splitlines()[6] == (
+        "import { User, reviveUser, mapUser } from './user';"
+    )
+    assert (tmp_path / "catalog.ts").read_text().endswith(
+        "export function mapCatalog(data: any): Catalog {\n"
+        "  return {\n"
+        "    createdAt: data.created_at,\n"
+        "    departmentMap: data.department_map == null ? data.department_map : "
+        "Object.fromEntries(Object.entries(data.department_map).map("
+        "([k0, v0]: [string, any]) => [k0, v0 == null ? v0 : mapDepartment(v0)])),\n"
+        "  };\n"
+        "}"
+    )
+    assert "lastLoggedIn: data.last_logged_in," in (tmp_path / "user.ts").read_text()
+
+
+def test_extends_converters(tmp_path: Path):
+    class ThingSerializer(serializers.Serializer):
+        owner_dept = DepartmentSerializer()
+        created_at = serializers.DateTimeField()
+
+    class GadgetSerializer(ThingSerializer):
+        size = serializers.IntegerField()
+
+    tasks = [
+        build(User),
+        build(DepartmentSerializer),
+        build(ThingSerializer),
+        build(GadgetSerializer, {"extends": True}),
+    ]
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path, tasks=tasks, revivers=True, mappers=True
+    )
+    TypeScriptBuilder(config).build_all()
+    gadget = (tmp_path / "gadget.ts").read_text()
+    assert "export interface Gadget extends Thing {" in gadget
+    assert "import { reviveDepartment, mapDepartment } from './department';" in gadget
+    assert (
+        "  if (data.ownerDept != null) reviveDepartment(data.ownerDept);\n"
+        "  if (data.createdAt != null) data.createdAt = new Date(data.createdAt);\n"
+    ) in gadget
+    assert (
+        "    ownerDept: data.owner_dept == null ? data.owner_dept : "
+        "mapDepartment(data.owner_dept),\n"
+    ) in gadget
+
+
+def test_nested_registered_reviver(tmp_path: Path):
+    @dataclass
+    class Leaf:
+        at: datetime
+
+    @dataclass
+    class Mid:
+        leaf: Leaf
+
+    @dataclass
+    class Top:
+        mid: Mid
+
+    with use_registry(TypeRegistry(parent=DEFAULT_TYPE_REGISTRY)):
+        tasks = [build(Leaf, {"alias": "LeafAlias"}), build(Mid), build(Top)]
+        config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=tasks, revivers=True)
+        TypeScriptBuilder(config).build_all()
+    # called by top, so defined even though dates of the registered leaf are unknown
+    assert (tmp_path / "mid.ts").read_text().endswith(
+        "export function reviveMid(data: any): Mid {\n  return data;\n}"
+    )
+    assert "if (data.mid != null) reviveMid(data.mid);" in (
+        tmp_path / "top.ts"
+    ).read_text()
+
+
+def test_lazy_tasks(tmp_path: Path):
+    def tasks():
+        yield build(PathSerializer, lazy=True)
+        yield build(PathWrapperSerializer, lazy=True)
+        yield build(ButtonType, lazy=True)
+
+    config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=tasks)
+    builder = TypeScriptBuilder(config)
+    assert all(task.code is None for task in builder.tasks)
+    builder.build_all()
+    assert all(task.code is None for task in builder.tasks)
+    assert skip_lines((tmp_path / "path.ts").read_text()) == PATH_INTERFACE
+    assert (tmp_path / "path-wrapper.ts").exists()
+    assert (tmp_path / "button-type.enum.ts").exists()
+    eager_task = build(PathSerializer)
+    eager_task.release()
+    assert eager_task.code is not None
+
+
+def test_pagination(tmp_path: Path):
+    tasks = [
+        build(PathSerializer),
+        build(DepartmentSerializer, {"paginated": "DepartmentPage"}),
+        build(User),
+    ]
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path,
+        tasks=tasks,
+        pagination_class=PageNumberPagination,
+        type_only_imports=True,
+    )
+    TypeScriptBuilder(config).build_all()
+    assert skip_lines((tmp_path / "paginated.ts").read_text()) == (
+        "export interface Paginated<T> {\n"
+        "  count: number;\n"
+        "  next: string | null;\n"
+        "  previous: string | null;\n"
+        "  results: T[];\n"
+        "}"
+    )
+    assert skip_lines((tmp_path / "path.ts").read_text()) == (
+        "import type { Paginated } from './paginated';\n\n"
+        + PATH_INTERFACE
+        + "\n\nexport type PaginatedPath = Paginated<Path>;"
+    )
+    assert (tmp_path / "department.ts").read_text().endswith(
+        "export type DepartmentPage = Paginated<Department>;"
+    )
+    assert "Paginated" not in (tmp_path / "user.ts").read_text()
+
+
+def test_custom_pagination():
+    class CursorlessPagination(BasePagination):
+        pass
+
+    assert build_paginated_interface(CursorlessPagination).content == (
+        "export interface Paginated<T> {\n"
+        "  results: T[];\n"
+        "}"
+    )
+
+
+def test_default_pagination(tmp_path: Path):
+    module = sys.modules["tests.tsgconfig"]
+    options = {"build_dir": str(tmp_path)}
+    assert Command().get_config(module, options).pagination_class is None
+    pagination = "rest_framework.pagination.LimitOffsetPagination"
+    with override_settings(REST_FRAMEWORK={"DEFAULT_PAGINATION_CLASS": pagination}):
+        config = Command().get_config(module, options)
+    assert config.pagination_class is LimitOffsetPagination
+
+
+def test_project_references(tmp_path: Path):
+    sub_dir = tmp_path / "sub"
+    tasks = [
+        build(PathSerializer, {"build_dir": sub_dir}),
+        build(PathWrapperSerializer),
+        build(User),
+    ]
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path,
+        tasks=tasks,
+        project_references=True,
+        tsconfig_extends=tmp_path / "tsconfig.base.json",
+    )
+    TypeScriptBuilder(config).build_all()
+    tsconfig = json.loads(skip_lines((tmp_path / "tsconfig.json").read_text()))
+    assert tsconfig == {
+        "extends": "./tsconfig.base.json",
+        "compilerOptions": {"composite": True},
+        "files": ["path-wrapper.ts", "user.ts"],
+        "references": [{"path": "./sub"}],
+    }
+    tsconfig = json.loads(skip_lines((sub_dir / "tsconfig.json").read_text()))
+    assert tsconfig == {
+        "extends": "../tsconfig.base.json",
+        "compilerOptions": {"composite": True},
+        "files": ["path.ts"],
+        "references": [],
+    }
+    # aggregates are a leaf project referenced by build directories importing them
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path,
+        tasks=tasks,
+        project_references=True,
+        pagination_class=PageNumberPagination,
+    )
+    TypeScriptBuilder(config).build_all()
+    tsconfig = json.loads(skip_lines((tmp_path / "tsconfig.json").read_text()))
+    assert tsconfig["files"] == ["path-wrapper.ts", "user.ts"]
+    assert tsconfig["references"] == [
+        {"path": "./sub"},
+        {"path": "./tsconfig.aggregates.json"},
+    ]
+    tsconfig = json.loads(skip_lines((sub_dir / "tsconfig.json").read_text()))
+    assert tsconfig["references"] == [{"path": "../tsconfig.aggregates.json"}]
+    tsconfig = json.loads(
+        skip_lines((tmp_path / "tsconfig.aggregates.json").read_text())
+    )
+    assert tsconfig == {
+        "compilerOptions": {"composite": True},
+        "files": ["paginated.ts"],
+        "references": [],
+    }
+    tasks.append(build(DepartmentSerializer, {"build_dir": sub_dir}))
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path, tasks=tasks, project_references=True
+    )
+    with pytest.raises(BuildException):
+        TypeScriptBuilder(config).build_all()
+
+
+def test_build_lock(tmp_path: Path):
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path, tasks=[build(User)], lock=True
+    )
+    builder = TypeScriptBuilder(config)
+    user_file = tmp_path / "user.ts"
+    with BuildLock(tmp_path):
+        thread = threading.Thread(target=builder.build_all)
+        thread.start()
+        thread.join(0.2)
+        assert thread.is_alive()
+        assert not user_file.exists()
+    thread.join()
+    assert user_file.exists()
+    # a build started after the request covers it
+    user_file.unlink()
+    with BuildLock(tmp_path) as lock:
+        lock.record(time.time() + 60)
+    builder.build_all()
+    assert not user_file.exists()
+    with BuildLock(tmp_path) as lock:
+        lock.record(time.time() + 60, key=builder.get_build_key([]))
+    builder.build_all()
+    assert user_file.exists()
+    # a build of sources loaded before the request does not cover it
+    builder = TypeScriptBuilder(config)
+    time.sleep(0.01)
+    requested = time.time()
+    builder.build_all()
+    with BuildLock(tmp_path) as lock:
+        assert not lock.is_covered(requested)
+
+
+def test_build_lock_processes(tmp_path: Path):
+    command = [sys.executable, "-m", "django", "buildtypescript", "tests", "--lock"]
+    command.append("--skip-checks")
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "tests.settings"}
+    processes = []
+    with BuildLock(tmp_path):
+        for _ in range(3):
+            process = subprocess.Popen(
+                [*command, "--build-dir", str(tmp_path)],
+                cwd=Path(__file__).parent.parent,
+                env=env,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+            processes.append(process)
+        # sources are loaded before waiting for the lock
+        for process in processes:
+            for line in process.stderr:
+                if "build tasks found" in line:
+                    break
+        time.sleep(0.2)
+    logs = [process.communicate()[1] for process in processes]
+    assert all(process.returncode == 0 for process in processes)
+    assert sum("Build coalesced" in log for log in logs) == 2
+    assert (tmp_path / "user.ts").exists()
+
+
+def test_dependency_closure(tmp_path: Path):
+    class Box:
+        pass
+
+    @dataclass
+    class Crate:
+        box: Box
+
+    tasks = [build(UserSerializer), build(ChildSerializer), build(Crate)]
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path, tasks=tasks, dependency_closure=True
+    )
+    builder = TypeScriptBuilder(config)
+    # a module shared by a dataclass and its serializer is generated once
+    assert [task.type for task in builder.tasks] == [
+        Crate,
+        ButtonType,
+        Department,
+        PathSerializer,
+        ParentSerializer,
+        UserSerializer,
+        ChildSerializer,
+    ]
+    assert builder.graph.dependencies[UserSerializer] == [
+        ButtonType,
+        Department,
+        PathSerializer,
+    ]
+    assert builder.graph.unresolved == {Box}
+    assert builder.graph.find_cycle() == []
+    builder.build_all()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "button-type.enum.ts",
+        "child.ts",
+        "crate.ts",
+        "department.ts",
+        "parent.ts",
+        "path.ts",
+        "user.ts",
+    ]
+
+    graph = TypeScriptBuildGraph(
+        tasks={
+            tp: build(tp, lazy=True)
+            for tp in (PathSerializer, ParentSerializer, ButtonType)
+        },
+        dependencies={
+            PathSerializer: [ParentSerializer],
+            ParentSerializer: [PathSerializer],
+            ButtonType: [],
+        },
+    )
+    assert [task.type for task in graph.get_order()] == [
+        ButtonType,
+        PathSerializer,
+        ParentSerializer,
+    ]
+    assert graph.find_cycle() == [ParentSerializer, PathSerializer, ParentSerializer]
+
+
+def test_affected_tasks(tmp_path: Path):
+    config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=BUILD_TASKS)
+    builder = TypeScriptBuilder(config)
+    assert builder.get_affected_tasks([]) == []
+    serializers_file = Path(PathSerializer.__module__.replace(".", "/") + ".py")
+    tasks = builder.get_affected_tasks([serializers_file])
+    assert [task.type.__name__ for task in tasks] == [
+        "PathSerializer",
+        "ParentSerializer",
+        "ChildSerializer",
+        "DepartmentSerializer",
+    ]
+    models_file = Path(User.__module__.replace(".", "/") + ".py")
+    assert builder.get_affected_tasks([models_file]) == BUILD_TASKS[1:]
+
+
+def test_partition_tasks():
+    shards = partition_tasks(BUILD_TASKS, 2)
+    assert [len(shard) for shard in shards] == [3, 3]
+    assert partition_tasks(BUILD_TASKS, 2) == shards
+    costs = {get_type_name(task.type): 1.0 for task in BUILD_TASKS}
+    costs["tests.models.User"] = 10.0
+    shards = partition_tasks(BUILD_TASKS, 2, costs)
+    assert [task.type for task in shards[0]] == [User]
+    assert len(shards[1]) == 5
+
+
+def test_shard(tmp_path: Path):
+    with lazy_tasks():
+        tasks = [
+            build(PathSerializer),
+            build(PathWrapperSerializer),
+            *(build(task.type, task.options) for task in BUILD_TASKS[1:]),
+        ]
+    single_dir = tmp_path / "single"
+    config = TypeScriptBuilderConfig(
+        build_dir=single_dir, tasks=tasks, shared_types=True, project_references=True
+    )
+    TypeScriptBuilder(config).build_all()
+    with pytest.raises(BuildException):
+        TypeScriptBuilder(
+            TypeScriptBuilderConfig(build_dir=tmp_path / "eager", tasks=BUILD_TASKS)
+        ).build_shard(1, 3)
+    manifests = []
+    for i in (1, 2, 3):
+        config = TypeScriptBuilderConfig(
+            build_dir=tmp_path / f"shard-{i}",
+            tasks=tasks,
+            shared_types=True,
+            project_references=True,
+        )
+        call_command(
+            "buildtypescript",
+            "tests",
+            "--shard",
+            f"{i}/3",
+            "--shard-manifest",
+            str(tmp_path / f"shard-{i}.json"),
+            "--build-dir",
+            str(tmp_path / f"shard-{i}"),
+        )
+        manifests.append(TypeScriptBuilder(config).build_shard(i, 3))
+    # tasks of config are lazy for sharded commands
+    assert all(task.code is None for task in sys.modules["tests.tsgconfig"].BUILD_TASKS)
+    merged_dir = tmp_path / "merged"
+    config = TypeScriptBuilderConfig(
+        build_dir=merged_dir, tasks=tasks, shared_types=True, project_references=True
+    )
+    builder = TypeScriptBuilder(config)
+    costs = builder.merge_shards(manifests)
+    assert set(costs) == {get_type_name(task.type) for task in tasks}
+    assert sorted(f.name for f in merged_dir.iterdir()) == sorted(
+        f.name for f in single_dir.iterdir()
+    )
+    for file in single_dir.iterdir():
+        assert get_digest(merged_dir / file.name) == get_digest(file)
+    with pytest.raises(BuildException):
+        builder.merge_shards(manifests[:2])
+    manifests[0]["tasks"][0]["content"] += " "
+    with pytest.raises(BuildException):
+        builder.merge_shards(manifests)
+    call_command(
+        "buildtypescript",
+        "tests",
+        "--build-dir",
+        str(tmp_path / "command"),
+        "--merge",
+        *(str(tmp_path / f"shard-{i}.json") for i in (1, 2, 3)),
+    )
+    assert len(list((tmp_path / "command").iterdir())) == len(BUILD_TASKS)
@@ -0,0 +1,71 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from django.core import checks
+from django.test import override_settings
+
+from django_rest_tsg.build import (
+    TypeScriptBuilder,
+    TypeScriptBuilderConfig,
+    get_stale_files,
+)
+from django_rest_tsg.checks import check_freshness
+from tests.tsgconfig import BUILD_TASKS
+
+
+def test_stale_files(tmp_path: Path):
+    manifest = tmp_path / "manifest.json"
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path / "build", tasks=BUILD_TASKS, manifest=manifest
+    )
+    TypeScriptBuilder(config).build_all()
+    assert get_stale_files(manifest) == []
+    content = json.loads(manifest.read_text())
+    # library and standard library modules depend on the machine
+    assert sorted(Path(source).name for source in content["sources"]) == [
+        "models.py",
+        "serializers.py",
+    ]
+    path_file = tmp_path / "build" / "path.ts"
+    path_file.unlink()
+    assert get_stale_files(manifest) == [path_file]
+    content = json.loads(manifest.read_text())
+    source = next(iter(content["sources"]))
+    content["sources"][source] = "0" * 64
+    manifest.write_text(json.dumps(content))
+    assert get_stale_files(manifest) == [tmp_path / source, path_file]
+
+
+def test_check_freshness(tmp_path: Path):
+    assert check_freshness in checks.registry.registry.get_checks()
+    manifest = tmp_path / "manifest.json"
+    with override_settings(TSG_MANIFEST=manifest):
+        errors = check_freshness()
+        assert [error.id for error in errors] == ["django_rest_tsg.W001"]
+        config = TypeScriptBuilderConfig(
+            build_dir=tmp_path / "build", tasks=BUILD_TASKS, manifest=manifest
+        )
+        TypeScriptBuilder(config).build_all()
+        assert check_freshness() == []
+        (tmp_path / "build" / "user.ts").write_text("")
+        errors = check_freshness()
+        assert [error.id for error in errors] == ["django_rest_tsg.W002"]
+    assert check_freshness() == []
+
+
+def test_lazy_import():
+    # the build module is not imported by django setup without TSG_MANIFEST
+    code = (
+        "import sys, django; django.setup(); "
+        "sys.exit('django_rest_tsg.build' in sys.modules)"
+    )
+    env = {**os.environ, "DJANGO_SETTINGS_MODULE": "tests.settings"}
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        env=env,
+        check=True,
+    )
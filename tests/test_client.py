@@ -0,0 +1,138 @@
+from pathlib import Path
+
+import pytest
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.routers import SimpleRouter
+
+from django_rest_tsg import typescript
+from django_rest_tsg.build import (
+    BuildException,
+    TypeScriptBuilder,
+    TypeScriptBuilderConfig,
+    build,
+    build_graph,
+)
+from django_rest_tsg.client import build_client
+from tests.serializers import DepartmentSerializer, PathSerializer
+from tests.views import DepartmentViewSet, PaginatedDepartmentViewSet, PathViewSet
+
+CLIENT_METHODS = """
+
+  departmentList(params?: QueryParams): Promise<Department[]> {
+    return this.get<Department[]>('departments/', params);
+  }
+
+  departmentCreate(data: Department): Promise<Department> {
+    return this.send<Department>('POST', 'departments/', 'departments/', data);
+  }
+
+  departmentRetrieve(lookup: string | number, params?: QueryParams): Promise<Department> {
+    return this.get<Department>('departments/' + encodeURIComponent(String(lookup)) + '/', params);
+  }
+
+  departmentUpdate(lookup: string | number, data: Department): Promise<Department> {
+    return this.send<Department>('PUT', 'departments/' + encodeURIComponent(String(lookup)) + '/', 'departments/', data);
+  }
+
+  departmentPartialUpdate(lookup: string | number, data: Partial<Department>): Promise<Department> {
+    return this.send<Department>('PATCH', 'departments/' + encodeURIComponent(String(lookup)) + '/', 'departments/', data);
+  }
+
+  departmentDestroy(lookup: string | number): Promise<void> {
+    return this.send<void>('DELETE', 'departments/' + encodeURIComponent(String(lookup)) + '/', 'departments/');
+  }
+
+  pathTreeGet(params?: QueryParams): Promise<Path> {
+    return this.get<Path>('paths/tree/', params);
+  }
+
+  pathTreePost(data: Path): Promise<Path> {
+    return this.send<Path>('POST', 'paths/tree/', 'paths/', data);
+  }
+
+  pathRetrieve(lookup: string | number, params?: QueryParams): Promise<Path> {
+    return this.get<Path>('paths/' + encodeURIComponent(String(lookup)) + '/', params);
+  }
+}"""
+
+
+def get_router():
+    router = SimpleRouter()
+    router.register("departments", DepartmentViewSet, basename="department")
+    router.register("paths", PathViewSet, basename="path")
+    return router
+
+
+def test_client():
+    code = build_client(get_router())
+    assert code.type == typescript.TypeScriptCodeType.CLIENT
+    assert code.name == "ApiClient"
+    assert code.dependencies == [DepartmentSerializer, PathSerializer]
+    assert "export class ApiClient {" in code.content
+    assert code.content.endswith(CLIENT_METHODS)
+
+
+def test_client_task():
+    task = build(get_router(), {"alias": "BackendClient"})
+    assert task.filename == "backend-client.ts"
+    assert "export class BackendClient {" in task.get_code().content
+
+
+def test_paginated_client():
+    router = SimpleRouter()
+    router.register("departments", PaginatedDepartmentViewSet, basename="department")
+    content = build_client(router).content
+    assert "Promise<Paginated<Department>> {" in content
+    assert "Promise<Department[]>" not in content
+    assert (
+        "departmentRetrieve(lookup: string | number, params?: QueryParams)" in content
+    )
+
+
+def test_paginated_client_task(tmp_path: Path):
+    router = SimpleRouter()
+    router.register("departments", PaginatedDepartmentViewSet, basename="department")
+    config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=[build(router)])
+    with pytest.raises(BuildException):
+        TypeScriptBuilder(config).build_all()
+    config.pagination_class = PageNumberPagination
+    TypeScriptBuilder(config).build_all()
+    content = (tmp_path / "api-client.ts").read_text()
+    assert "import { Paginated } from './paginated';" in content
+
+
+def test_multiple_clients(tmp_path: Path):
+    public_router = SimpleRouter()
+    public_router.register("paths", PathViewSet, basename="path")
+    tasks = [
+        build(get_router(), {"alias": "AdminClient", "build_dir": tmp_path / "admin"}),
+        build(public_router, {"alias": "PublicClient"}),
+    ]
+    config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=tasks)
+    TypeScriptBuilder(config).build_all()
+    assert (
+        "export class AdminClient {"
+        in (tmp_path / "admin" / "admin-client.ts").read_text()
+    )
+    assert "export class PublicClient {" in (tmp_path / "public-client.ts").read_text()
+    graph = build_graph(tasks)
+    assert [task.name for task in graph.tasks.values() if task.router] == [
+        "rest_framework.routers.SimpleRouter:AdminClient",
+        "rest_framework.routers.SimpleRouter:PublicClient",
+    ]
+
+
+def test_client_aliases(tmp_path: Path):
+    router = SimpleRouter(trailing_slash=False)
+    router.register("departments", DepartmentViewSet, basename="department")
+    registry = typescript.TypeRegistry(parent=typescript.DEFAULT_TYPE_REGISTRY)
+    with typescript.use_registry(registry):
+        # the alias is declared after the client referring to it
+        tasks = [build(router), build(DepartmentSerializer, {"alias": "Dept"})]
+    config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=tasks)
+    TypeScriptBuilder(config).build_all()
+    content = (tmp_path / "api-client.ts").read_text()
+    assert "import { Dept } from './dept';" in content
+    assert "Promise<Dept[]>" in content
+    assert "Department" not in content
+    assert "'departments/' + encodeURIComponent(String(lookup)), params)" in content
@@ -0,0 +1,46 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from django_rest_tsg.build import TypeScriptBuilder, TypeScriptBuilderConfig
+from django_rest_tsg.daemon import TypeScriptBuildServer, main, send_request
+from tests.tsgconfig import BUILD_TASKS
+
+
+@pytest.fixture()
+def server(tmp_path: Path):
+    def load_builder(reload: bool = False):
+        config = TypeScriptBuilderConfig(build_dir=tmp_path / "build", tasks=BUILD_TASKS)
+        return TypeScriptBuilder(config)
+
+    server = TypeScriptBuildServer(str(tmp_path / "tsg.sock"), load_builder)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+def test_daemon(server: TypeScriptBuildServer, tmp_path: Path):
+    socket_path = server.socket_path
+    assert send_request(socket_path, {"command": "ping"}) == {"ok": True}
+    response = send_request(socket_path, {"command": "check"})
+    assert not response["ok"]
+    assert len(response["stale"]) == len(BUILD_TASKS)
+    assert send_request(socket_path, {"command": "build"}) == {
+        "ok": True,
+        "tasks": len(BUILD_TASKS),
+    }
+    assert len(list((tmp_path / "build").iterdir())) == len(BUILD_TASKS)
+    assert main([socket_path, "check"]) == 0
+    assert not send_request(socket_path, {"command": "foobar"})["ok"]
+
+
+def test_daemon_restart(server: TypeScriptBuildServer):
+    file = next(iter(server.mtimes))
+    server.mtimes[file] -= 1
+    response = send_request(server.socket_path, {"command": "build"})
+    assert response == {"ok": False, "restart": True}
+    assert server.restart
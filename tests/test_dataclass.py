@@ -1,5 +1,13 @@
+import sys
+import threading
+from dataclasses import dataclass
+from typing import List, Literal, Optional, Union
+
+import pytest
+
 from django_rest_tsg import typescript
-from tests.models import User, Department, UserList
+from django_rest_tsg.build import build
+from tests.models import ButtonType, User, Department, UserList
 
 
 USER_INTERFACE = """export interface User {
@@ -47,3 +55,126 @@ def test_dataclass():
     assert code.content == user_list_interface
     assert code.type == typescript.TypeScriptCodeType.INTERFACE
     assert code.source == UserList
+
+
+def test_builtin_generics():
+    assert typescript.build_type(list[int]) == ("Array<number>", [])
+    assert typescript.build_type(dict[str, list[User]]) == (
+        "{[key: string]: Array<User>}",
+        [],
+    )
+    assert typescript.build_type(Optional[Union[int, str]]) == (
+        "number | string | null",
+        [],
+    )
+    assert typescript.build_type(Literal["a", 1, True]) == ("'a' | 1 | true", [])
+    assert typescript.build_type(List[ButtonType]) == (
+        "Array<ButtonType>",
+        [ButtonType],
+    )
+
+
+def test_large_unions():
+    codes = [f"code{i}" for i in range(10000)]
+    assert typescript.build_type(Literal[tuple(codes)]) == (
+        " | ".join(f"'{code}'" for code in codes),
+        [],
+    )
+    classes = [type(f"Code{i}", (), {}) for i in range(1000)]
+    assert typescript.build_type(Union[tuple(classes + [int, float])]) == (
+        " | ".join(f"Code{i}" for i in range(1000)) + " | number",
+        classes,
+    )
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 requires python 3.10")
+def test_pep604_union():
+    assert typescript.build_type(int | None) == ("number | null", [])
+    assert typescript.build_type(list[int | str] | None) == (
+        "Array<number | string> | null",
+        [],
+    )
+
+
+def test_type_registry():
+    @dataclass
+    class Tag:
+        name: str
+
+    @dataclass
+    class Post:
+        tags: List[Tag]
+
+    registry = typescript.TypeRegistry(parent=typescript.DEFAULT_TYPE_REGISTRY)
+    version = registry.version
+    with typescript.use_registry(registry):
+        typescript.register(Tag, "Label")
+        assert typescript.build_type(List[Tag]) == ("Array<Label>", [])
+        assert typescript.build_type(User) == ("User", [])
+        task = build(Post, lazy=True)
+    assert registry.version == version + 1
+    assert Tag not in typescript.DEFAULT_TYPE_REGISTRY.types
+    assert typescript.build_type(List[Tag]) == ("Array<Tag>", [Tag])
+    # lazy tasks are generated in the registry of their scope
+    results = []
+    thread = threading.Thread(target=lambda: results.append(task.get_code()))
+    thread.start()
+    thread.join()
+    assert "  tags: Array<Label>;" in results[0].content
+
+
+def test_user_defined_type_mapping():
+    @dataclass
+    class Tag:
+        name: str
+
+    assert typescript.build_type(List[Tag]) == ("Array<Tag>", [Tag])
+    typescript.USER_DEFINED_TYPE_MAPPING[Tag] = "Label"
+    try:
+        assert typescript.build_type(List[Tag]) == ("Array<Label>", [])
+    finally:
+        del typescript.USER_DEFINED_TYPE_MAPPING[Tag]
+    assert typescript.build_type(List[Tag]) == ("Array<Tag>", [Tag])
+
+
+def test_dataclass_inheritance():
+    @dataclass
+    class Entity:
+        id: int
+        owner: User
+
+    @dataclass
+    class Document(Entity):
+        title: str
+
+    task = build(Document, {"extends": True})
+    assert task.get_code().content == (
+        "export interface Document extends Entity {\n  title: string;\n}"
+    )
+    assert task.get_code().dependencies == [Entity]
+
+
+def test_dataclass_inheritance_alias():
+    @dataclass
+    class Entity:
+        id: int
+
+    @dataclass
+    class Document(Entity):
+        title: str
+
+    with typescript.use_registry(
+        typescript.TypeRegistry(parent=typescript.DEFAULT_TYPE_REGISTRY)
+    ):
+        # base aliased by a later task
+        tasks = [build(Document, {"extends": True}), build(Entity, {"alias": "Audit"})]
+        assert tasks[0].get_code().content == (
+            "export interface Document extends Audit {\n  title: string;\n}"
+        )
+
+
+def test_tokenize_python_type():
+    with pytest.deprecated_call():
+        tokens = typescript.tokenize_python_type(List[Optional[int]])
+    assert tokens == [list, "[", Union, "[", int, type(None), "]", "]"]
+    assert typescript.TYPE_MAPPING_WITH_GENERIC_FALLBACK[dict] == "object"
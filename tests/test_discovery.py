@@ -0,0 +1,79 @@
+from pathlib import Path
+
+from django_rest_tsg import discovery
+from django_rest_tsg.build import build
+from django_rest_tsg.discovery import discover_tasks, find_candidates
+from tests.models import ButtonType, Coordinate, PermissionFlag, User
+from tests.serializers import (
+    ChildSerializer,
+    DepartmentSerializer,
+    ParentSerializer,
+    PathSerializer,
+    PathWrapperSerializer,
+    UserSerializer,
+)
+
+
+def test_find_candidates():
+    modules = [
+        {
+            "module": "a",
+            "classes": [
+                ["BaseSerializer", ["Serializer"], []],
+                ["Color", ["TextChoices"], []],
+                ["Tag", [], ["register"]],
+                ["Point", [], ["dataclass"]],
+                ["Helper", ["object"], []],
+            ],
+            "registered": ["Point"],
+        },
+        {
+            "module": "b",
+            "classes": [["Base", ["BaseSerializer"], []], ["Foo", ["Base"], []]],
+            "registered": [],
+        },
+        {"module": "c", "classes": [["Helper", [], []]], "registered": []},
+    ]
+    assert find_candidates(modules) == {
+        "a": ["BaseSerializer", "Color", "Tag", "Point"],
+        "b": ["Base", "Foo"],
+    }
+
+
+def test_discover_tasks(tmp_path: Path, monkeypatch):
+    index_file = tmp_path / "index.json"
+    explicit_task = build(PathSerializer, {"alias": "FilePath"})
+    tasks = discover_tasks(["tests"], index_file, [explicit_task], lazy=True)
+    assert tasks[0] is explicit_task
+    types = [task.type for task in tasks]
+    assert types.count(PathSerializer) == 1
+    for tp in (
+        PermissionFlag,
+        ButtonType,
+        User,
+        ParentSerializer,
+        ChildSerializer,
+        PathWrapperSerializer,
+        DepartmentSerializer,
+        UserSerializer,
+    ):
+        assert tp in types
+    assert all(task.code is None for task in tasks[1:])
+    # registered names are aliases
+    (coordinate_task,) = [task for task in tasks if task.type is Coordinate]
+    assert coordinate_task.options["alias"] == "Point"
+    assert "export interface Point {" in coordinate_task.get_code().content
+    assert index_file.exists()
+
+    # unchanged modules are not parsed again, neither in memory nor from index file
+    parsed = []
+    index_module = discovery.index_module
+    monkeypatch.setattr(
+        discovery,
+        "index_module",
+        lambda *args: parsed.append(args) or index_module(*args),
+    )
+    monkeypatch.setattr(discovery, "DISCOVERY_INDEX", {})
+    tasks = discover_tasks(["tests"], index_file, lazy=True)
+    assert {task.type for task in tasks} == set(types)
+    assert parsed == []
@@ -33,3 +33,28 @@ def test_str_enum():
     assert code.content == button_type
     assert code.type == typescript.TypeScriptCodeType.ENUM
     assert code.source == ButtonType
+
+
+def test_const_enum():
+    code = typescript.build_enum(
+        PermissionFlag, enforce_uppercase=True, enum_style="const"
+    )
+    assert code.content == PERMISSION_FLAG_ENUM.replace(
+        "export enum", "export const enum"
+    )
+    assert code.type == typescript.TypeScriptCodeType.ENUM
+
+
+def test_object_enum():
+    button_type = """export const ButtonType = {
+  Primary: 'primary',
+  DisabledPrimary: 'primary disabled',
+  Secondary: 'secondary',
+  DisabledSecondary: 'secondary disabled'
+} as const;
+export type ButtonType = (typeof ButtonType)[keyof typeof ButtonType];"""
+    code = typescript.build_enum(
+        ButtonType, enum_style=typescript.TypeScriptEnumStyle.OBJECT
+    )
+    assert code.content == button_type
+    assert code.type == typescript.TypeScriptCodeType.ENUM
@@ -0,0 +1,42 @@
+import json
+from pathlib import Path
+
+from django.test import override_settings
+from django.utils import translation
+from rest_framework.metadata import SimpleMetadata
+
+from django_rest_tsg.build import TypeScriptBuilder, TypeScriptBuilderConfig, build
+from django_rest_tsg.metadata import StaticMetadata
+from tests.models import User
+from tests.serializers import DepartmentSerializer, PathSerializer
+
+
+def test_static_metadata(tmp_path: Path):
+    metadata_file = tmp_path / "metadata.json"
+    config = TypeScriptBuilderConfig(
+        build_dir=tmp_path,
+        tasks=[build(PathSerializer), build(User)],
+        metadata=metadata_file,
+    )
+    TypeScriptBuilder(config).build_all()
+    artifact = json.loads(metadata_file.read_text())
+    assert list(artifact["serializers"]) == ["tests.serializers.PathSerializer"]
+    info = artifact["serializers"]["tests.serializers.PathSerializer"]
+    expected = SimpleMetadata().get_serializer_info(PathSerializer())
+    assert info == json.loads(json.dumps(expected, default=str))
+
+    # infos are served from the artifact, not from serializer fields
+    info["name"]["label"] = "Static name"
+    metadata_file.write_text(json.dumps(artifact))
+    metadata = StaticMetadata()
+    with override_settings(TSG_METADATA=metadata_file):
+        static_info = metadata.get_serializer_info(PathSerializer())
+        assert static_info["name"]["label"] == "Static name"
+        assert metadata.get_serializer_info(PathSerializer(many=True)) is static_info
+        dynamic_info = metadata.get_serializer_info(DepartmentSerializer())
+        assert dynamic_info == SimpleMetadata().get_serializer_info(
+            DepartmentSerializer()
+        )
+        with translation.override("fr"):
+            assert metadata.get_serializer_info(PathSerializer()) == expected
+    assert metadata.get_serializer_info(PathSerializer()) == expected
@@ -0,0 +1,70 @@
+import json
+
+from rest_framework import serializers
+
+from django_rest_tsg import typescript
+from django_rest_tsg.renderers import (
+    CamelCaseJSONRenderer,
+    CamelCaseSerializerMixin,
+    get_key_plan,
+)
+
+
+class TagSerializer(serializers.Serializer):
+    tag_name = serializers.CharField()
+
+
+class PostSerializer(serializers.Serializer):
+    post_title = serializers.CharField()
+    main_tag = TagSerializer()
+    all_tags = TagSerializer(many=True)
+    tag_groups = serializers.DictField(
+        child=serializers.ListField(child=TagSerializer())
+    )
+    extra_data = serializers.JSONField()
+
+
+class CamelCasePostSerializer(CamelCaseSerializerMixin, PostSerializer):
+    pass
+
+
+POST = {
+    "post_title": "Hello",
+    "main_tag": {"tag_name": "a"},
+    "all_tags": [{"tag_name": "b"}],
+    "tag_groups": {"group_one": [{"tag_name": "c"}]},
+    "extra_data": {"snake_case": 1},
+}
+
+CAMEL_CASE_POST = {
+    "postTitle": "Hello",
+    "mainTag": {"tagName": "a"},
+    "allTags": [{"tagName": "b"}],
+    "tagGroups": {"group_one": [{"tagName": "c"}]},
+    "extraData": {"snake_case": 1},
+}
+
+
+def test_key_plan():
+    plan = get_key_plan(PostSerializer)
+    assert get_key_plan(PostSerializer) is plan
+    code = typescript.build_interface_from_serializer(PostSerializer)
+    for _, (name, _) in plan.items():
+        assert f"  {name}: " in code.content
+
+
+def test_renderer():
+    renderer = CamelCaseJSONRenderer()
+    data = PostSerializer(POST).data
+    assert json.loads(renderer.render(data)) == CAMEL_CASE_POST
+    data = PostSerializer([POST], many=True).data
+    page = {"count": 1, "results": data}
+    assert json.loads(renderer.render(page)) == {
+        "count": 1,
+        "results": [CAMEL_CASE_POST],
+    }
+    assert json.loads(renderer.render({"snake_case": 1})) == {"snake_case": 1}
+
+
+def test_serializer_mixin():
+    assert CamelCasePostSerializer(POST).data == CAMEL_CASE_POST
@@ -1,3 +1,5 @@
+from rest_framework import serializers
+
 from django_rest_tsg import typescript
 from tests.serializers import (
     ChildSerializer,
@@ -89,3 +91,34 @@ def test_dataclass_serializer():
     assert code.content == DEPARTMENT_INTERFACE
     assert code.type == typescript.TypeScriptCodeType.INTERFACE
     assert code.source == DepartmentSerializer
+
+
+def test_serializer_inheritance():
+    class AuditSerializer(serializers.Serializer):
+        created_at = serializers.DateTimeField()
+        note = serializers.CharField()
+        path = PathSerializer()
+
+    class ArticleSerializer(AuditSerializer):
+        title = serializers.CharField()
+        note = serializers.IntegerField()
+
+    class SameArticleSerializer(AuditSerializer):
+        pass
+
+    assert typescript.get_interface_base(ArticleSerializer) == AuditSerializer
+    assert typescript.get_interface_base(AuditSerializer) is None
+    code = typescript.build_interface_from_serializer(
+        ArticleSerializer, base=AuditSerializer
+    )
+    assert code.content == (
+        "export interface Article extends Omit<Audit, 'note'> {\n"
+        "  note: number;\n"
+        "  title: string;\n"
+        "}"
+    )
+    assert code.dependencies == [AuditSerializer]
+    code = typescript.build_interface_from_serializer(
+        SameArticleSerializer, base=AuditSerializer
+    )
+    assert code.content == "export interface SameArticle extends Audit {}"
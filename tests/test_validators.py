@@ -0,0 +1,139 @@
+import re
+from pathlib import Path
+
+from django.core.validators import RegexValidator
+from rest_framework import serializers
+
+from django_rest_tsg.build import TypeScriptBuilder, TypeScriptBuilderConfig, build
+from django_rest_tsg.validators import build_validator, get_javascript_pattern
+from tests.serializers import PathWrapperSerializer
+
+
+class SignUpSerializer(serializers.Serializer):
+    user_name = serializers.RegexField(r"^[a-z]+\Z", max_length=16, min_length=2)
+    nickname = serializers.CharField(
+        max_length=8, allow_blank=True, allow_null=True, required=False
+    )
+    age = serializers.IntegerField(min_value=13)
+    plan = serializers.ChoiceField(choices=[("free", "Free"), ("pro", "Pro")])
+    agreed = serializers.BooleanField(required=False, allow_null=True)
+    created_at = serializers.DateTimeField(read_only=True)
+
+
+SIGN_UP_VALIDATOR = """const requiredMessage = 'This field is required.';
+const nullMessage = 'This field may not be null.';
+const userNamePattern = new RegExp('^[a-z]+$');
+const planChoices = new Set(['free', 'pro']);
+
+export function validateSignUp(data: any, partial: boolean = false): {[key: string]: string[]} {
+  const errors: {[key: string]: string[]} = {};
+  for (const name of ['userName', 'age', 'plan']) {
+    if (!partial && data[name] === undefined) errors[name] = [requiredMessage];
+  }
+  for (const name of ['userName', 'age', 'plan']) {
+    if (data[name] === null) errors[name] = [nullMessage];
+  }
+  {
+    const value = data.userName;
+    if (value != null) {
+      const text = String(value).trim();
+      if (text === '') {
+        errors.userName = ['This field may not be blank.'];
+      } else {
+        const messages: string[] = [];
+        if (text.length > 16) messages.push('Ensure this field has no more than 16 characters.');
+        if (text.length < 2) messages.push('Ensure this field has at least 2 characters.');
+        if (!userNamePattern.test(text)) messages.push('This value does not match the required pattern.');
+        if (messages.length) errors.userName = messages;
+      }
+    }
+  }
+  {
+    const value = data.nickname;
+    if (value != null) {
+      const text = String(value).trim();
+      if (text !== '') {
+        if (text.length > 8) errors.nickname = ['Ensure this field has no more than 8 characters.'];
+      }
+    }
+  }
+  {
+    const value = data.age;
+    if (value != null) {
+      if (Number(value) < 13) errors.age = ['Ensure this value is greater than or equal to 13.'];
+    }
+  }
+  {
+    const value = data.plan;
+    if (value != null) {
+      if (!planChoices.has(String(value))) errors.plan = [`"${value}" is not a valid choice.`];
+    }
+  }
+  return errors;
+}"""
+
+
+def test_build_validator():
+    content, dependencies = build_validator(SignUpSerializer, "SignUp", [], None)
+    assert content == SIGN_UP_VALIDATOR
+    assert dependencies == []
+
+
+def test_javascript_pattern():
+    assert get_javascript_pattern(RegexValidator(r"\A(?P<a>x)(?P=a)\\Z\Z")) == (
+        r"new RegExp('^(?<a>x)\\k<a>\\\\Z$')"
+    )
+    assert get_javascript_pattern(RegexValidator(re.compile("ab", re.I))) == (
+        "new RegExp('ab', 'i')"
+    )
+    assert get_javascript_pattern(RegexValidator(r"(?i)ab")) is None
+    assert get_javascript_pattern(RegexValidator(re.compile("a b", re.X))) is None
+    # atomic groups, conditionals and possessive quantifiers
+    for pattern in [r"(?>ab)c", r"(a)?(?(1)b|c)", "a*+", "a++", "a?+", "a{2}+"]:
+        assert get_javascript_pattern(RegexValidator(pattern)) is None
+    assert get_javascript_pattern(RegexValidator(r"a\++")) == r"new RegExp('a\\++')"
+    # \w, \d and \b only match ascii in javascript
+    assert get_javascript_pattern(RegexValidator(r"^\w+\d\b")) is None
+    assert get_javascript_pattern(RegexValidator(r"^\\w")) == r"new RegExp('^\\\\w')"
+    assert get_javascript_pattern(RegexValidator(re.compile(r"^\w+", re.A))) == (
+        r"new RegExp('^\\w+')"
+    )
+
+
+def test_choice_keys():
+    class FlagSerializer(serializers.Serializer):
+        flag = serializers.ChoiceField(choices=[(True, "Yes"), (False, "No")])
+        size = serializers.ChoiceField(choices=[(1.5, "Small")])
+
+    content, _ = build_validator(FlagSerializer, "Flag", [], None)
+    assert "const flagChoices = new Set(['true', 'false']);" in content
+    assert "sizeChoices" not in content
+
+
+def test_custom_messages():
+    class NameSerializer(serializers.Serializer):
+        first_name = serializers.CharField()
+        last_name = serializers.CharField(error_messages={"required": "Who are you?"})
+
+    content, _ = build_validator(NameSerializer, "Name", [], None)
+    assert content.startswith(
+        "const requiredMessage = 'This field is required.';\n"
+        "const nullMessage = 'This field may not be null.';\n\n"
+    )
+    assert (
+        "  if (!partial && data.firstName === undefined) "
+        "errors.firstName = [requiredMessage];\n"
+        "  if (!partial && data.lastName === undefined) "
+        "errors.lastName = ['Who are you?'];\n"
+        "  for (const name of ['firstName', 'lastName']) {\n"
+        "    if (data[name] === null) errors[name] = [nullMessage];\n"
+        "  }\n"
+    ) in content
+
+
+def test_validators_option(tmp_path: Path):
+    tasks = [build(SignUpSerializer), build(PathWrapperSerializer)]
+    config = TypeScriptBuilderConfig(build_dir=tmp_path, tasks=tasks, validators=True)
+    TypeScriptBuilder(config).build_all()
+    assert (tmp_path / "sign-up.ts").read_text().endswith(SIGN_UP_VALIDATOR)
+    assert "validatePathWrapper" in (tmp_path / "path-wrapper.ts").read_text()
@@ -0,0 +1,22 @@
+from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.pagination import PageNumberPagination
+
+from tests.serializers import DepartmentSerializer, PathSerializer
+
+
+class DepartmentViewSet(viewsets.ModelViewSet):
+    serializer_class = DepartmentSerializer
+
+
+class PathViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
+    serializer_class = PathSerializer
+
+    @action(detail=False, methods=["get", "post"])
+    def tree(self, request):
+        pass
+
+
+class PaginatedDepartmentViewSet(viewsets.ModelViewSet):
+    serializer_class = DepartmentSerializer
+    pagination_class = PageNumberPagination